@@ -0,0 +1,10 @@
+"""Project-wide pytest setup: make the project packages importable."""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent
+
+# Make `src` and the web scraper's `scrapers` package importable from tests
+sys.path.insert(0, str(PROJECT_ROOT / "mcp-servers" / "web-scraper"))
+sys.path.insert(0, str(PROJECT_ROOT))
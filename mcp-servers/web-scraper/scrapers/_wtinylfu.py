@@ -0,0 +1,181 @@
+"""W-TinyLFU admission/eviction policy for bounded caches.
+
+A small LRU window absorbs new keys; keys leaving the window must beat the
+main segment's eviction victim on estimated access frequency to be admitted.
+Frequencies are tracked in a count-min sketch with periodic halving, so
+one-hit wonders never push popular entries out of the cache.
+"""
+
+from collections import OrderedDict
+from typing import Hashable, List
+
+
+class CountMinSketch:
+    """Approximate frequency counter with 4-bit saturating counters."""
+
+    MAX_COUNT = 15  # 4-bit counters
+
+    def __init__(self, width: int, depth: int = 4, sample_size: int = 0):
+        """
+        Initialize sketch.
+
+        Args:
+            width: Counters per row (roughly 10x the cache capacity)
+            depth: Number of rows / hash functions
+            sample_size: Increments before all counters are halved
+                (default: 10x width)
+        """
+        self.width = max(1, width)
+        self.depth = depth
+        self.sample_size = sample_size or 10 * self.width
+        self._rows = [bytearray(self.width) for _ in range(depth)]
+        self._additions = 0
+
+    def _indexes(self, key: Hashable):
+        for seed, row in enumerate(self._rows):
+            yield row, hash((seed, key)) % self.width
+
+    def increment(self, key: Hashable):
+        """Record one access of key."""
+        for row, idx in self._indexes(key):
+            if row[idx] < self.MAX_COUNT:
+                row[idx] += 1
+
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key: Hashable) -> int:
+        """Estimate how often key was accessed."""
+        return min(row[idx] for row, idx in self._indexes(key))
+
+    def _age(self):
+        """Halve all counters so old popularity fades out."""
+        for row in self._rows:
+            for i, count in enumerate(row):
+                row[i] = count >> 1
+        self._additions //= 2
+
+
+class WTinyLFU:
+    """
+    Tracks resident keys of a bounded cache and decides what to evict.
+
+    Layout: 1% window LRU, remaining 99% split into a segmented LRU with
+    20% probation and 80% protected.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize policy.
+
+        Args:
+            capacity: Maximum number of resident keys
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.capacity = capacity
+        self.window_capacity = max(1, capacity // 100)
+        self.main_capacity = capacity - self.window_capacity
+        self.protected_capacity = int(self.main_capacity * 0.8)
+
+        self._window: OrderedDict = OrderedDict()
+        self._probation: OrderedDict = OrderedDict()
+        self._protected: OrderedDict = OrderedDict()
+        self.sketch = CountMinSketch(width=10 * capacity)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._window or key in self._probation or key in self._protected
+
+    def __len__(self) -> int:
+        return len(self._window) + len(self._probation) + len(self._protected)
+
+    def record_access(self, key: Hashable):
+        """
+        Record an access (hit or miss) of key.
+
+        Resident keys are also moved up in recency; a hit in probation
+        promotes the key to the protected segment.
+        """
+        self.sketch.increment(key)
+
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+        elif key in self._probation:
+            del self._probation[key]
+            self._protected[key] = None
+            if len(self._protected) > self.protected_capacity:
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+
+    def add(self, key: Hashable) -> List[Hashable]:
+        """
+        Make key resident.
+
+        Args:
+            key: Newly cached key
+
+        Returns:
+            Keys evicted from the cache (possibly including a key that lost
+            the admission contest on leaving the window)
+        """
+        if key in self:
+            self.record_access(key)
+            return []
+
+        self._window[key] = None
+        if len(self._window) <= self.window_capacity:
+            return []
+
+        candidate, _ = self._window.popitem(last=False)
+
+        if len(self._probation) + len(self._protected) < self.main_capacity:
+            self._probation[candidate] = None
+            return []
+
+        if not self._probation:
+            # Everything in main is protected; nothing to contest against
+            return [candidate]
+
+        victim = next(iter(self._probation))
+        if self.sketch.estimate(candidate) > self.sketch.estimate(victim):
+            del self._probation[victim]
+            self._probation[candidate] = None
+            return [victim]
+
+        return [candidate]
+
+    def adopt(self, key: Hashable) -> bool:
+        """
+        Make key resident without an admission contest.
+
+        Used to restore entries persisted by a previous run, when the sketch
+        has no frequencies yet to compare.
+
+        Args:
+            key: Already cached key
+
+        Returns:
+            False if the cache is full and key was not adopted
+        """
+        if key in self:
+            return True
+
+        if len(self._probation) + len(self._protected) < self.main_capacity:
+            self._probation[key] = None
+            return True
+
+        if len(self._window) < self.window_capacity:
+            self._window[key] = None
+            return True
+
+        return False
+
+    def discard(self, key: Hashable):
+        """Forget key (e.g. its entry expired or was removed externally)."""
+        self._window.pop(key, None)
+        self._probation.pop(key, None)
+        self._protected.pop(key, None)
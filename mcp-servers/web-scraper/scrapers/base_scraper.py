@@ -1,31 +1,37 @@
 """Base web scraper with safety features (robots.txt, rate limiting, caching)."""
 
+import os
 import time
-import hashlib
 import urllib.robotparser
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
-from dataclasses import dataclass
-import json
 
+import msgspec
 import requests
+import xxhash
 from bs4 import BeautifulSoup
 from loguru import logger
 
+from ._wtinylfu import WTinyLFU
 
-@dataclass
-class ScrapedContent:
+
+class ScrapedContent(msgspec.Struct, omit_defaults=True):
     """Scraped content container."""
     url: str
     title: str
     content: str
-    links: List[Dict[str, str]]
+    links: List[Dict[str, Any]]
     metadata: Dict[str, Any]
     scraped_at: datetime
     cached: bool = False
 
 
+# Typed codecs for the on-disk cache (msgspec is much faster than stdlib json)
+_cache_encoder = msgspec.json.Encoder()
+_cache_decoder = msgspec.json.Decoder(ScrapedContent)
+
+
 class RobotsChecker:
     """Check robots.txt compliance."""
 
@@ -108,7 +114,7 @@ class RateLimiter:
             time_since_last = now - self.last_request_time
             if time_since_last < self.delay:
                 sleep_time = self.delay - time_since_last
-                logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
+                logger.debug("Rate limiting: sleeping {:.2f}s", sleep_time)
                 time.sleep(sleep_time)
                 now = time.time()
 
@@ -121,7 +127,7 @@ class RateLimiter:
             oldest = self.request_times[0]
             sleep_time = 60 - (now - oldest)
             if sleep_time > 0:
-                logger.debug(f"RPM limit: sleeping {sleep_time:.2f}s")
+                logger.debug("RPM limit: sleeping {:.2f}s", sleep_time)
                 time.sleep(sleep_time)
                 now = time.time()
 
@@ -132,21 +138,42 @@ class RateLimiter:
 class ContentCache:
     """File-based cache for scraped content."""
 
-    def __init__(self, cache_dir: str, default_ttl: int = 86400):
+    def __init__(self, cache_dir: str, default_ttl: int = 86400, max_entries: Optional[int] = None):
         """
         Initialize content cache.
 
         Args:
             cache_dir: Directory for cache storage
             default_ttl: Default TTL in seconds (default: 24 hours)
+            max_entries: Maximum number of cached pages (default: unbounded).
+                When set, eviction uses W-TinyLFU so rarely requested pages
+                don't displace popular ones.
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.default_ttl = default_ttl
+        self.policy: Optional[WTinyLFU] = None
+
+        if max_entries:
+            self.policy = WTinyLFU(max_entries)
+
+            # Adopt the newest entries left over from previous runs and drop
+            # the rest. The kept ones are adopted oldest first, so the oldest
+            # is the first eviction victim.
+            existing = sorted(self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+            self._evict(cache_file.stem for cache_file in existing[max_entries:])
+            for cache_file in reversed(existing[:max_entries]):
+                self.policy.adopt(cache_file.stem)
+
+    def _evict(self, cache_keys):
+        """Remove evicted entries from disk."""
+        for cache_key in cache_keys:
+            self._get_cache_path(cache_key).unlink(missing_ok=True)
+            logger.debug("Evicted cache entry {}", cache_key)
 
     def _get_cache_key(self, url: str) -> str:
-        """Generate cache key from URL."""
-        return hashlib.md5(url.encode()).hexdigest()
+        """Generate cache key from URL (non-cryptographic, filenames only)."""
+        return f"{xxhash.xxh3_64_intdigest(url.encode()):016x}"
 
     def _get_cache_path(self, cache_key: str) -> Path:
         """Get cache file path."""
@@ -167,31 +194,29 @@ class ContentCache:
             cache_key = self._get_cache_key(url)
             cache_path = self._get_cache_path(cache_key)
 
+            if self.policy is not None:
+                self.policy.record_access(cache_key)
+
             if not cache_path.exists():
+                if self.policy is not None:
+                    self.policy.discard(cache_key)
                 return None
 
             # Check if expired
             ttl = ttl or self.default_ttl
             file_age = time.time() - cache_path.stat().st_mtime
             if file_age > ttl:
-                logger.debug(f"Cache expired for {url} (age: {file_age:.0f}s)")
+                logger.debug("Cache expired for {} (age: {:.0f}s)", url, file_age)
                 return None
 
             # Load from cache
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(cache_path, 'rb') as f:
+                content = _cache_decoder.decode(f.read())
 
             logger.info(f"Cache hit for {url}")
 
-            return ScrapedContent(
-                url=data['url'],
-                title=data['title'],
-                content=data['content'],
-                links=data['links'],
-                metadata=data['metadata'],
-                scraped_at=datetime.fromisoformat(data['scraped_at']),
-                cached=True
-            )
+            content.cached = True
+            return content
 
         except Exception as e:
             logger.error(f"Error reading cache for {url}: {e}")
@@ -208,19 +233,16 @@ class ContentCache:
             cache_key = self._get_cache_key(content.url)
             cache_path = self._get_cache_path(cache_key)
 
-            data = {
-                'url': content.url,
-                'title': content.title,
-                'content': content.content,
-                'links': content.links,
-                'metadata': content.metadata,
-                'scraped_at': content.scraped_at.isoformat()
-            }
+            # Stored without the 'cached' flag; it is set on read.
+            # Written to a temp file and renamed, so readers never see a partial entry.
+            tmp_path = cache_path.with_suffix('.tmp')
+            tmp_path.write_bytes(_cache_encoder.encode(msgspec.structs.replace(content, cached=False)))
+            os.replace(tmp_path, cache_path)
 
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if self.policy is not None:
+                self._evict(self.policy.add(cache_key))
 
-            logger.debug(f"Cached content for {content.url}")
+            logger.debug("Cached content for {}", content.url)
 
         except Exception as e:
             logger.error(f"Error writing cache for {content.url}: {e}")
@@ -241,6 +263,8 @@ class ContentCache:
                 file_age = now - cache_file.stat().st_mtime
                 if file_age > ttl:
                     cache_file.unlink()
+                    if self.policy is not None:
+                        self.policy.discard(cache_file.stem)
                     cleared += 1
             except Exception as e:
                 logger.error(f"Error clearing cache file {cache_file}: {e}")
@@ -259,9 +283,11 @@ class BaseWebScraper:
         rate_limit_rpm: int = 10,
         delay_between_requests: float = 2.0,
         cache_ttl: int = 86400,
+        cache_max_entries: Optional[int] = None,
         timeout: tuple = (10, 30),
         max_retries: int = 3,
-        respect_robots: bool = True
+        respect_robots: bool = True,
+        cache: Optional[ContentCache] = None
     ):
         """
         Initialize base web scraper.
@@ -272,9 +298,13 @@ class BaseWebScraper:
             rate_limit_rpm: Requests per minute limit
             delay_between_requests: Minimum delay between requests
             cache_ttl: Cache TTL in seconds
+            cache_max_entries: Maximum number of cached pages (default: unbounded)
             timeout: (connect_timeout, read_timeout) in seconds
             max_retries: Maximum retry attempts
             respect_robots: Whether to respect robots.txt
+            cache: Content cache to use instead of creating one from cache_dir.
+                Scrapers writing to the same directory must share one cache,
+                so a bounded cache applies one eviction policy to all pages.
         """
         self.user_agent = user_agent
         self.timeout = timeout
@@ -283,7 +313,7 @@ class BaseWebScraper:
 
         # Initialize components
         self.rate_limiter = RateLimiter(rate_limit_rpm, delay_between_requests)
-        self.cache = ContentCache(cache_dir, cache_ttl)
+        self.cache = cache if cache is not None else ContentCache(cache_dir, cache_ttl, cache_max_entries)
         self.robots_checker = RobotsChecker() if respect_robots else None
 
         # Session setup
@@ -1,5 +1,6 @@
 """Gov.uk specific web scraper."""
 
+import re
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
@@ -12,6 +13,9 @@ from .base_scraper import BaseWebScraper, ScrapedContent
 class GovUkScraper(BaseWebScraper):
     """Scraper specifically designed for Gov.uk content."""
 
+    # Trailing site name in <title>, e.g. "Housing - GOV.UK" or "Housing | GOV.UK"
+    _TITLE_SUFFIX_RE = re.compile(r'\s*[-|]\s*GOV\.UK\s*$', re.IGNORECASE)
+
     def __init__(
         self,
         user_agent: str,
@@ -137,7 +141,7 @@ class GovUkScraper(BaseWebScraper):
         if title_tag:
             title_text = title_tag.get_text(strip=True)
             # Remove common Gov.uk suffixes
-            title_text = title_text.replace(' - GOV.UK', '')
+            title_text = self._TITLE_SUFFIX_RE.sub('', title_text)
             return title_text
 
         return "Untitled"
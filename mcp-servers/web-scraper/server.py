@@ -10,9 +10,16 @@ from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 from loguru import logger
 
+from scrapers.base_scraper import ContentCache
 from scrapers.opora_scraper import OporaUkScraper
 from scrapers.govuk_scraper import GovUkScraper
 
+# libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class WebScraperMCPServer:
     """MCP Server for web scraping functionality."""
@@ -33,11 +40,16 @@ class WebScraperMCPServer:
         user_agent = scraping_config.get('user_agent', 'UkraineSupportBot/1.0')
         cache_dir = scraping_config.get('cache', {}).get('directory', '/app/cache/html')
         cache_ttl = scraping_config.get('cache', {}).get('default_ttl', 86400)
+        cache_max_entries = scraping_config.get('cache', {}).get('max_entries')
+
+        # Both scrapers write to the same directory, so they share one cache
+        # (and one eviction policy) rather than each tracking the files alone
+        cache = ContentCache(cache_dir, cache_ttl, cache_max_entries)
 
         self.opora_scraper = OporaUkScraper(
             user_agent=user_agent,
             cache_dir=cache_dir,
-            cache_ttl=cache_ttl,
+            cache=cache,
             rate_limit_rpm=scraping_config.get('rate_limit', {}).get('requests_per_minute', 10),
             delay_between_requests=scraping_config.get('rate_limit', {}).get('delay_between_requests', 2.0),
             timeout=tuple(scraping_config.get('timeout', {}).values()),
@@ -48,7 +60,7 @@ class WebScraperMCPServer:
         self.govuk_scraper = GovUkScraper(
             user_agent=user_agent,
             cache_dir=cache_dir,
-            cache_ttl=cache_ttl,
+            cache=cache,
             rate_limit_rpm=scraping_config.get('rate_limit', {}).get('requests_per_minute', 10),
             delay_between_requests=scraping_config.get('rate_limit', {}).get('delay_between_requests', 2.0),
             timeout=tuple(scraping_config.get('timeout', {}).values()),
@@ -65,7 +77,7 @@ class WebScraperMCPServer:
         """Load configuration from YAML file."""
         try:
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=SafeLoader)
             logger.info(f"Loaded configuration from {self.config_path}")
             return config
         except Exception as e:
@@ -14,7 +14,7 @@ from src.utils.logger import get_logger
 logger = get_logger()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentResponse:
     """Standardized agent response structure."""
     text: str
@@ -68,7 +68,7 @@ class BaseAgent(ABC):
         start_time = time.time()
 
         try:
-            logger.info(f"{self.name}: Processing query: '{query[:50]}...'")
+            logger.info("{}: Processing query: '{}...'", self.name, query[:50])
 
             # Initialize retriever if needed
             if not self.retriever._connected:
@@ -78,11 +78,11 @@ class BaseAgent(ABC):
             retrieval_result = await self._retrieve_context(query)
 
             if retrieval_result.found_documents == 0:
-                logger.warning(f"{self.name}: No documents found for query")
+                logger.warning("{}: No documents found for query", self.name)
                 # Still proceed with generation but note lack of context
             else:
                 logger.info(
-                    f"{self.name}: Retrieved {retrieval_result.found_documents} documents"
+                    "{}: Retrieved {} documents", self.name, retrieval_result.found_documents
                 )
 
             # Generate response using LLM
@@ -94,9 +94,7 @@ class BaseAgent(ABC):
 
             processing_time = time.time() - start_time
 
-            logger.info(
-                f"{self.name}: Generated response in {processing_time:.2f}s"
-            )
+            logger.info("{}: Generated response in {:.2f}s", self.name, processing_time)
 
             return AgentResponse(
                 text=response_text,
@@ -112,7 +110,7 @@ class BaseAgent(ABC):
             )
 
         except Exception as e:
-            logger.error(f"{self.name}: Error processing query: {e}")
+            logger.error("{}: Error processing query: {}", self.name, e)
             processing_time = time.time() - start_time
 
             # Return error response
@@ -148,7 +146,7 @@ class BaseAgent(ABC):
                 topic_filter=self.topic_filter
             )
         except Exception as e:
-            logger.error(f"{self.name}: RAG retrieval failed: {e}")
+            logger.error("{}: RAG retrieval failed: {}", self.name, e)
             # Return empty result
             from src.rag.retriever import RetrievalResult
             return RetrievalResult(
@@ -179,7 +177,7 @@ class BaseAgent(ABC):
             # Build user prompt with context
             user_prompt = self._build_user_prompt(query, context)
 
-            logger.debug(f"{self.name}: Calling Ollama with model {self.model}")
+            logger.debug("{}: Calling Ollama with model {}", self.name, self.model)
 
             # Call Ollama
             client = ollama.Client(host=self.settings.ollama_base_url)
@@ -198,14 +196,12 @@ class BaseAgent(ABC):
 
             response_text = response["message"]["content"]
 
-            logger.debug(
-                f"{self.name}: LLM generated {len(response_text)} characters"
-            )
+            logger.debug("{}: LLM generated {} characters", self.name, len(response_text))
 
             return response_text
 
         except Exception as e:
-            logger.error(f"{self.name}: LLM generation failed: {e}")
+            logger.error("{}: LLM generation failed: {}", self.name, e)
             raise
 
     def _build_user_prompt(self, query: str, context: str) -> str:
@@ -8,10 +8,21 @@ from src.utils.logger import get_logger
 
 logger = get_logger()
 
+# Location of the web scraper MCP server package inside the container
+WEB_SCRAPER_PATH = '/app/mcp-servers/web-scraper'
+WEB_SCRAPER_CACHE_DIR = '/app/mcp-servers/web-scraper/cache/html'
+
 
 class HousingAgent(BaseAgent):
     """Specialized agent for housing and life support questions."""
 
+    # Query keywords that make fresh web content worth fetching
+    FRESHNESS_KEYWORDS = (
+        'recent', 'latest', 'new', 'current', 'today', 'now',
+        'останні', 'нові', 'актуальні', 'поточні', 'свіжі'
+    )
+    SCHEME_KEYWORDS = ('homes for ukraine', 'ukraine scheme', 'схема', 'програма')
+
     def __init__(self):
         """Initialize Housing Agent."""
         settings = get_settings()
@@ -99,7 +110,7 @@ class HousingAgent(BaseAgent):
         start_time = time.time()
 
         try:
-            logger.info(f"{self.name}: Processing query with web search: '{query[:50]}...'")
+            logger.info("{}: Processing query with web search: '{}...'", self.name, query[:50])
 
             # Initialize retriever if needed
             if not self.retriever._connected:
@@ -113,7 +124,7 @@ class HousingAgent(BaseAgent):
 
             web_content = None
             if needs_web_search and self.use_web_search:
-                logger.info(f"{self.name}: Supplementing RAG with web search")
+                logger.info("{}: Supplementing RAG with web search", self.name)
                 web_content = await self._perform_web_search(query)
 
             # Step 3: Combine RAG and web search results
@@ -142,8 +153,8 @@ class HousingAgent(BaseAgent):
                 })
 
             logger.info(
-                f"{self.name}: Generated response in {processing_time:.2f}s "
-                f"(RAG: {retrieval_result.found_documents} docs, Web: {1 if web_content else 0})"
+                "{}: Generated response in {:.2f}s (RAG: {} docs, Web: {})",
+                self.name, processing_time, retrieval_result.found_documents, 1 if web_content else 0
             )
 
             return AgentResponse(
@@ -161,7 +172,7 @@ class HousingAgent(BaseAgent):
             )
 
         except Exception as e:
-            logger.error(f"{self.name}: Error processing query: {e}")
+            logger.error("{}: Error processing query: {}", self.name, e)
             processing_time = time.time() - start_time
 
             # Return error response
@@ -191,16 +202,15 @@ class HousingAgent(BaseAgent):
             logger.debug("Web search triggered: low RAG document count")
             return True
 
+        query_lower = query.lower()
+
         # 2. Query mentions "recent", "latest", "new", "current"
-        freshness_keywords = ['recent', 'latest', 'new', 'current', 'today', 'now',
-                             'останні', 'нові', 'актуальні', 'поточні', 'свіжі']
-        if any(keyword in query.lower() for keyword in freshness_keywords):
+        if any(keyword in query_lower for keyword in self.FRESHNESS_KEYWORDS):
             logger.debug("Web search triggered: freshness keywords detected")
             return True
 
         # 3. Query is about specific government schemes (might have recent updates)
-        scheme_keywords = ['homes for ukraine', 'ukraine scheme', 'схема', 'програма']
-        if any(keyword in query.lower() for keyword in scheme_keywords):
+        if any(keyword in query_lower for keyword in self.SCHEME_KEYWORDS):
             logger.debug("Web search triggered: government scheme query")
             return True
 
@@ -220,8 +230,10 @@ class HousingAgent(BaseAgent):
         try:
             # Use direct scraper import (simpler than MCP for now)
             import sys
-            sys.path.insert(0, '/app/mcp-servers/web-scraper')
+            if WEB_SCRAPER_PATH not in sys.path:
+                sys.path.insert(0, WEB_SCRAPER_PATH)
 
+            from scrapers.base_scraper import ContentCache
             from scrapers.govuk_scraper import GovUkScraper
             from scrapers.opora_scraper import OporaUkScraper
 
@@ -237,20 +249,27 @@ class HousingAgent(BaseAgent):
             from src.utils.config import get_settings
             settings = get_settings()
 
+            # Both scrapers share one bounded cache, as in the MCP server
+            cache = ContentCache(
+                WEB_SCRAPER_CACHE_DIR,
+                default_ttl=86400,
+                max_entries=settings.scraper_cache_max_entries
+            )
+
             # Initialize scrapers with configured base URLs
             govuk = GovUkScraper(
                 user_agent='UkraineSupportBot/1.0',
-                cache_dir='/app/mcp-servers/web-scraper/cache/html',
+                cache_dir=WEB_SCRAPER_CACHE_DIR,
                 base_url=settings.scraper_gov_uk_base,
-                cache_ttl=86400,
+                cache=cache,
                 respect_robots=True
             )
 
             opora = OporaUkScraper(
                 user_agent='UkraineSupportBot/1.0',
-                cache_dir='/app/mcp-servers/web-scraper/cache/html',
+                cache_dir=WEB_SCRAPER_CACHE_DIR,
                 base_url=settings.scraper_opora_uk_base,
-                cache_ttl=86400,
+                cache=cache,
                 respect_robots=True
             )
 
@@ -278,7 +297,7 @@ class HousingAgent(BaseAgent):
                     )
 
                     if use_pagination:
-                        logger.info(f"Using pagination to fetch from {settings.scraper_opora_uk_base}")
+                        logger.info("Using pagination to fetch from {}", settings.scraper_opora_uk_base)
                         # Use pagination for blog listing
                         opora_scraped = opora.fetch_with_pagination(
                             start_url=settings.scraper_opora_uk_base,
@@ -304,7 +323,7 @@ class HousingAgent(BaseAgent):
             return None
 
         except Exception as e:
-            logger.error(f"Web search failed: {e}")
+            logger.error("Web search failed: {}", e)
             import traceback
             logger.error(traceback.format_exc())
             return None
@@ -345,7 +364,9 @@ class HousingAgent(BaseAgent):
 
         combined = "\n".join(parts)
 
-        logger.debug(f"Combined context length: {len(combined)} chars "
-                    f"(RAG: {len(rag_context)}, Web: {len(web_content.content) if web_content else 0})")
+        logger.debug(
+            "Combined context length: {} chars (RAG: {}, Web: {})",
+            len(combined), len(rag_context), len(web_content.content) if web_content else 0
+        )
 
         return combined
@@ -10,7 +10,7 @@ from mcp.client.stdio import stdio_client, StdioServerParameters
 from loguru import logger
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WebSearchResult:
     """Web search result from MCP server."""
     content: str
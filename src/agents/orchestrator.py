@@ -1,13 +1,16 @@
 """Orchestrator agent for routing queries to specialized agents."""
 
-from typing import Dict, List, Optional
+import re
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-import ollama
-
-from src.agents.base_agent import BaseAgent, AgentResponse
 from src.utils.config import get_settings
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    # Agents pull in the retriever and vector store; keyword routing does not need them
+    from src.agents.base_agent import BaseAgent, AgentResponse
+
 logger = get_logger()
 
 
@@ -41,6 +44,12 @@ class OrchestratorAgent:
         ]
     }
 
+    # One alternation per intent (longest keywords first) to find matching intents in C
+    INTENT_PATTERNS = {
+        category: re.compile("|".join(map(re.escape, sorted(set(keywords), key=len, reverse=True))))
+        for category, keywords in INTENT_CATEGORIES.items()
+    }
+
     def __init__(self):
         """Initialize orchestrator."""
         self.settings = get_settings()
@@ -59,20 +68,20 @@ class OrchestratorAgent:
         Returns:
             Agent type: "visa", "housing", "work", or "general"
         """
-        logger.info(f"Routing query: '{query[:50]}...'")
+        logger.info("Routing query: '{}...'", query[:50])
 
         # Stage 1: Fast keyword-based classification
         keyword_intent = self._keyword_classify(query)
 
         if keyword_intent != "uncertain":
-            logger.info(f"Keyword classification: {keyword_intent}")
+            logger.info("Keyword classification: {}", keyword_intent)
             return keyword_intent
 
         # Stage 2: LLM-based classification for uncertain cases
         logger.info("Using LLM classification for uncertain query")
         llm_intent = await self._llm_classify(query)
 
-        logger.info(f"LLM classification: {llm_intent}")
+        logger.info("LLM classification: {}", llm_intent)
         return llm_intent
 
     def _keyword_classify(self, query: str) -> str:
@@ -86,22 +95,29 @@ class OrchestratorAgent:
             Intent category or "uncertain"
         """
         query_lower = query.lower()
-        scores = {}
+        matched = [
+            category for category, pattern in self.INTENT_PATTERNS.items()
+            if pattern.search(query_lower)
+        ]
 
-        for category, keywords in self.INTENT_CATEGORIES.items():
-            score = sum(1 for kw in keywords if kw in query_lower)
-            scores[category] = score
+        # Threshold for confidence (need at least 1 keyword match)
+        if not matched:
+            return "uncertain"
 
-        max_score = max(scores.values())
+        if len(matched) == 1:
+            logger.debug("Keyword match: {}", matched[0])
+            return matched[0]
 
-        # Threshold for confidence (need at least 1 keyword match)
-        if max_score >= 1:
-            # Get category with highest score
-            best_category = max(scores, key=scores.get)
-            logger.debug(f"Keyword scores: {scores}, selected: {best_category}")
-            return best_category
+        # Several intents matched: score them by number of keywords found
+        scores = {
+            category: sum(1 for kw in self.INTENT_CATEGORIES[category] if kw in query_lower)
+            for category in matched
+        }
 
-        return "uncertain"
+        # Get category with highest score
+        best_category = max(scores, key=scores.get)
+        logger.debug("Keyword scores: {}, selected: {}", scores, best_category)
+        return best_category
 
     async def _llm_classify(self, query: str) -> str:
         """
@@ -127,6 +143,9 @@ class OrchestratorAgent:
 
 Категорія:"""
 
+            # Imported on first use: only uncertain queries reach the LLM
+            import ollama
+
             client = ollama.Client(host=self.settings.ollama_base_url)
 
             response = client.chat(
@@ -165,7 +184,7 @@ class OrchestratorAgent:
             # Fallback to general
             return "general"
 
-    def get_agent(self, agent_type: str) -> BaseAgent:
+    def get_agent(self, agent_type: str) -> "BaseAgent":
         """
         Get the appropriate specialized agent.
 
@@ -183,7 +202,7 @@ class OrchestratorAgent:
         agent = self._agents.get(agent_type)
 
         if agent is None:
-            logger.warning(f"Unknown agent type: {agent_type}, using fallback")
+            logger.warning("Unknown agent type: {}, using fallback", agent_type)
             return self._agents["general"]
 
         return agent
@@ -198,16 +217,17 @@ class OrchestratorAgent:
         from src.agents.work_agent import WorkAgent
         from src.agents.fallback_agent import FallbackAgent
 
-        self._agents = {
+        # Read-only registry: agents are built once and shared by all queries
+        self._agents = MappingProxyType({
             "visa": VisaAgent(),
             "housing": HousingAgent(),
             "work": WorkAgent(),
             "general": FallbackAgent()
-        }
+        })
 
         logger.info("All agents initialized")
 
-    async def process_with_routing(self, query: str) -> AgentResponse:
+    async def process_with_routing(self, query: str) -> "AgentResponse":
         """
         Route query and process with appropriate agent.
 
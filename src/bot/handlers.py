@@ -22,6 +22,11 @@ from src.utils.logger import get_logger
 
 logger = get_logger()
 
+# Membership sets for per-update checks
+GROUP_CHAT_TYPES = frozenset({"group", "supergroup"})
+NOT_MEMBER_STATUSES = frozenset({ChatMemberStatus.LEFT, ChatMemberStatus.BANNED})
+MEMBER_STATUSES = frozenset({ChatMemberStatus.MEMBER, ChatMemberStatus.ADMINISTRATOR})
+
 
 class RateLimiter:
     """Simple rate limiter for bot requests."""
@@ -199,12 +204,12 @@ class BotHandlers:
             new_status = chat_member.new_chat_member.status
 
             # Check if bot was just added to a group
-            was_not_member = old_status in [ChatMemberStatus.LEFT, ChatMemberStatus.BANNED]
-            is_now_member = new_status in [ChatMemberStatus.MEMBER, ChatMemberStatus.ADMINISTRATOR]
+            was_not_member = old_status in NOT_MEMBER_STATUSES
+            is_now_member = new_status in MEMBER_STATUSES
 
             if was_not_member and is_now_member:
                 # Bot was added to the group
-                if chat.type in ["group", "supergroup"]:
+                if chat.type in GROUP_CHAT_TYPES:
                     logger.info(
                         f"Bot added to group: {chat.title} (ID: {chat.id}) "
                         f"by user {chat_member.from_user.username or 'Unknown'}"
@@ -221,7 +226,7 @@ class BotHandlers:
                     logger.info(f"Welcome message sent to group {chat.title}")
 
             # Log if bot was removed
-            elif is_now_member and old_status in [ChatMemberStatus.LEFT, ChatMemberStatus.BANNED]:
+            elif is_now_member and old_status in NOT_MEMBER_STATUSES:
                 logger.info(
                     f"Bot removed from group: {chat.title} (ID: {chat.id})"
                 )
@@ -246,12 +251,12 @@ class BotHandlers:
             chat_type = update.effective_chat.type
 
             logger.info(
-                f"Message from {username} (ID: {user_id}) "
-                f"in {chat_type}: {message_text[:50]}..."
+                "Message from {} (ID: {}) in {}: {}...",
+                username, user_id, chat_type, message_text[:50]
             )
 
             # Check if bot should respond (in groups, only respond to mentions)
-            if chat_type in ["group", "supergroup"]:
+            if chat_type in GROUP_CHAT_TYPES:
                 if not self._should_respond_in_group(update, context):
                     logger.debug("Ignoring group message without mention")
                     return
@@ -259,14 +264,14 @@ class BotHandlers:
             # Check rate limit
             allowed, rate_limit_msg = self.rate_limiter.check_rate_limit(user_id)
             if not allowed:
-                logger.warning(f"Rate limit exceeded for user {user_id}")
+                logger.warning("Rate limit exceeded for user {}", user_id)
                 await message.reply_text(rate_limit_msg)
                 return
 
             # Validate content
             is_valid, error_msg = self.content_filter.validate_query(message_text)
             if not is_valid:
-                logger.warning(f"Invalid content from user {user_id}: {error_msg}")
+                logger.warning("Invalid content from user {}: {}", user_id, error_msg)
                 await message.reply_text(
                     f"⚠️ {error_msg}\n\nСпробуйте переформулювати питання."
                 )
@@ -277,17 +282,17 @@ class BotHandlers:
             bot_username = self.settings.telegram_bot_username
             if bot_username and f"@{bot_username}" in message_text:
                 clean_query = message_text.replace(f"@{bot_username}", "").strip()
-                logger.debug(f"Stripped bot mention, clean query: {clean_query[:50]}...")
+                logger.debug("Stripped bot mention, clean query: {}...", clean_query[:50])
 
             # Language detection
             detected_lang = self.language_detector.detect(clean_query)
-            logger.info(f"Detected language: {detected_lang}")
+            logger.info("Detected language: {}", detected_lang)
 
             # Translate Russian to Ukrainian if needed
             query_ua = clean_query
             if detected_lang == "ru" and self.settings.auto_translate_russian:
                 query_ua = await self.translator.translate_ru_to_ua(clean_query)
-                logger.info(f"Translated: {query_ua[:50]}...")
+                logger.info("Translated: {}...", query_ua[:50])
 
             # Process with orchestrator
             response = await self.orchestrator.process_with_routing(query_ua)
@@ -295,7 +300,7 @@ class BotHandlers:
             # Validate safety
             is_safe, validated_response = self.safety_validator.validate(response)
             if not is_safe:
-                logger.warning(f"Response failed safety check for user {user_id}")
+                logger.warning("Response failed safety check for user {}", user_id)
                 validated_response = self.safety_validator.get_safe_fallback(
                     response.agent_name
                 )
@@ -312,7 +317,7 @@ class BotHandlers:
                 )
             except Exception as markdown_error:
                 # If Markdown parsing fails, retry without parse_mode
-                logger.warning(f"Markdown parsing failed, retrying with plain text: {markdown_error}")
+                logger.warning("Markdown parsing failed, retrying with plain text: {}", markdown_error)
                 await message.reply_text(
                     formatted_message,
                     parse_mode=None,
@@ -322,19 +327,19 @@ class BotHandlers:
             # Log performance
             processing_time = time.time() - start_time
             logger.info(
-                f"Response sent to {username} in {processing_time:.2f}s "
-                f"(agent: {validated_response.agent_name})"
+                "Response sent to {} in {:.2f}s (agent: {})",
+                username, processing_time, validated_response.agent_name
             )
 
             # Check if response time exceeds target
             if processing_time > self.settings.response_timeout_seconds:
                 logger.warning(
-                    f"Response time exceeded target: {processing_time:.2f}s "
-                    f"> {self.settings.response_timeout_seconds}s"
+                    "Response time exceeded target: {:.2f}s > {}s",
+                    processing_time, self.settings.response_timeout_seconds
                 )
 
         except Exception as e:
-            logger.exception(f"Error handling message: {e}")
+            logger.exception("Error handling message: {}", e)
             await self._send_error_response(update, e)
 
     def _should_respond_in_group(
@@ -383,7 +388,7 @@ class BotHandlers:
             else:
                 logger.error("Cannot send error response: no message in update")
         except Exception as e:
-            logger.error(f"Failed to send error response: {e}")
+            logger.error("Failed to send error response: {}", e)
 
 
 # Singleton instance
@@ -1,5 +1,7 @@
 """Main entry point for the Telegram bot application."""
 
+import asyncio
+
 from telegram import Update
 from telegram.ext import Application, CommandHandler, MessageHandler, ChatMemberHandler, filters, ContextTypes
 
@@ -7,6 +9,11 @@ from src.bot.handlers import get_bot_handlers
 from src.utils.config import get_settings
 from src.utils.logger import setup_logger, get_logger
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (not available on Windows)
+    uvloop = None
+
 # Initialize logger
 setup_logger()
 logger = get_logger()
@@ -57,6 +64,11 @@ def main():
     # Add error handler
     application.add_error_handler(error_handler)
 
+    # Run on uvloop's libuv-based event loop when available
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+
     # Start bot
     logger.info("Bot is starting polling...")
     logger.info("Multi-agent system initialized and ready!")
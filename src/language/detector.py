@@ -12,28 +12,32 @@ class LanguageDetector:
     """Detects language of user messages (Ukrainian or Russian)."""
 
     # Ukrainian-specific characters that don't exist in Russian
-    UKRAINIAN_CHARS = set("ґєії")
+    UKRAINIAN_CHARS = frozenset("ґєії")
 
     # Russian-specific characters that don't exist in Ukrainian
-    RUSSIAN_CHARS = set("ыэъё")
+    RUSSIAN_CHARS = frozenset("ыэъё")
+
+    # UTF-8 lead bytes of the Cyrillic block U+0400..U+04FF: each code point
+    # in the block encodes as one of these followed by a continuation byte
+    CYRILLIC_LEAD_BYTES = bytes(range(0xD0, 0xD4))
 
     # Common Ukrainian words
-    UKRAINIAN_WORDS = {
+    UKRAINIAN_WORDS = frozenset({
         "як", "що", "де", "коли", "чому", "який", "яка", "які",
         "ви", "ти", "він", "вона", "вони", "ми", "я",
         "дякую", "будь ласка", "вітаю", "привіт",
         "може", "можу", "треба", "потрібно",
         "допоможіть", "допомогти", "зробити", "отримати"
-    }
+    })
 
     # Common Russian words
-    RUSSIAN_WORDS = {
+    RUSSIAN_WORDS = frozenset({
         "как", "что", "где", "когда", "почему", "который", "которая", "которые",
         "вы", "ты", "он", "она", "они", "мы", "я",
         "спасибо", "пожалуйста", "привет",
         "может", "могу", "нужно", "надо",
         "помогите", "помочь", "сделать", "получить"
-    }
+    })
 
     def detect(self, text: str) -> Literal["uk", "ru", "unknown"]:
         """
@@ -45,7 +49,13 @@ class LanguageDetector:
         Returns:
             "uk" for Ukrainian, "ru" for Russian, "unknown" if unclear
         """
-        if not text or not text.strip():
+        # isspace() checks in place; strip() would allocate a copy
+        if not text or text.isspace():
+            return "unknown"
+
+        # No Cyrillic possible, none of the methods below can match
+        if text.isascii():
+            logger.debug("Could not determine language")
             return "unknown"
 
         text_lower = text.lower()
@@ -68,7 +78,7 @@ class LanguageDetector:
         ukrainian_score = sum(1 for word in words if word in self.UKRAINIAN_WORDS)
         russian_score = sum(1 for word in words if word in self.RUSSIAN_WORDS)
 
-        logger.debug(f"Word scores - Ukrainian: {ukrainian_score}, Russian: {russian_score}")
+        logger.debug("Word scores - Ukrainian: {}, Russian: {}", ukrainian_score, russian_score)
 
         if ukrainian_score > russian_score:
             logger.debug("Detected Ukrainian by words")
@@ -78,9 +88,11 @@ class LanguageDetector:
             logger.debug("Detected Russian by words")
             return "ru"
 
-        # Method 3: Check Cyrillic ratio (if mostly Cyrillic, assume Ukrainian by default)
-        cyrillic_count = sum(1 for char in text if '\u0400' <= char <= '\u04FF')
-        total_letters = sum(1 for char in text if char.isalpha())
+        # Method 3: Check Cyrillic ratio (if mostly Cyrillic, assume Ukrainian by default).
+        # Counted in C: Cyrillic via lead bytes of the UTF-8 encoding, letters via str.isalpha
+        encoded = text.encode("utf-8", "surrogatepass")
+        cyrillic_count = len(encoded) - len(encoded.translate(None, self.CYRILLIC_LEAD_BYTES))
+        total_letters = sum(map(str.isalpha, text))
 
         if total_letters > 0:
             cyrillic_ratio = cyrillic_count / total_letters
@@ -30,7 +30,7 @@ class Translator:
             return text
 
         try:
-            logger.info(f"Translating Russian text: '{text[:50]}...'")
+            logger.info("Translating Russian text: '{}...'", text[:50])
 
             translation_prompt = f"""Переклади наступний текст з російської мови на українську.
 
@@ -67,7 +67,7 @@ class Translator:
 
             translated_text = response["message"]["content"].strip()
 
-            logger.info(f"Translation completed: '{translated_text[:50]}...'")
+            logger.info("Translation completed: '{}...'", translated_text[:50])
 
             return translated_text
 
@@ -18,7 +18,7 @@ class ChunkingStrategy(Enum):
     PARAGRAPH = "paragraph"  # Paragraph-aware chunking
 
 
-@dataclass
+@dataclass(slots=True)
 class TextChunk:
     """Represents a chunk of text with metadata."""
     text: str
@@ -1,11 +1,12 @@
 """Document loader for manual documents from filesystem."""
 
-import json
 import os
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
 
+import msgspec
+
 from src.utils.config import get_settings
 from src.utils.logger import get_logger
 
@@ -89,8 +90,8 @@ class ManualDocumentLoader:
             try:
                 logger.info(f"Loading JSON file: {json_file}")
 
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(json_file, 'rb') as f:
+                    data = msgspec.json.decode(f.read())
 
                 # Get file modification time as fallback date
                 file_mtime = datetime.fromtimestamp(os.path.getmtime(json_file))
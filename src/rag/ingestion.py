@@ -1,11 +1,14 @@
 """Data ingestion pipeline for RAG system."""
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass, asdict
 
+import msgspec
+import xxhash
+
 from src.scrapers.govuk_scraper import scrape_govuk
 from src.scrapers.opora_scraper import scrape_opora
 from src.rag.chunker import DocumentChunker, ChunkingStrategy, TextChunk
@@ -16,8 +19,46 @@ from src.utils.logger import get_logger
 
 logger = get_logger()
 
+# Metadata that changes on every load even when the content does not
+_VOLATILE_METADATA = ("scraped_at",)
+
+# Fingerprint of the documents last stored successfully by this process
+_last_ingested_fingerprint: Optional[int] = None
+
+# Fingerprint of the documents last saved as artifacts by this process
+_last_saved_fingerprint: Optional[int] = None
+
+
+def fingerprint_documents(documents: List[Dict[str, Any]]) -> int:
+    """
+    Compute a cheap fingerprint of a document set.
 
-@dataclass
+    Volatile metadata (load timestamps) is ignored, so reloading unchanged
+    sources yields the same fingerprint.
+
+    Args:
+        documents: Documents with 'text' and 'metadata' fields
+
+    Returns:
+        64-bit fingerprint
+    """
+    stable = [
+        (
+            doc.get("text", ""),
+            {k: v for k, v in doc.get("metadata", {}).items() if k not in _VOLATILE_METADATA}
+        )
+        for doc in documents
+    ]
+    return xxhash.xxh3_64_intdigest(msgspec.json.encode(stable, order="deterministic"))
+
+
+def _write_json(path, data: Any):
+    """Write data to path as indented UTF-8 JSON."""
+    with open(path, 'wb') as f:
+        f.write(msgspec.json.format(msgspec.json.encode(data), indent=2))
+
+
+@dataclass(slots=True)
 class IngestionStats:
     """Statistics for an ingestion run."""
     run_timestamp: str
@@ -38,8 +79,7 @@ class IngestionStats:
 
     def save(self, path: str):
         """Save stats to JSON file."""
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        _write_json(path, self.to_dict())
 
 
 class DataIngestionPipeline:
@@ -89,15 +129,38 @@ class DataIngestionPipeline:
         Returns:
             IngestionStats with results
         """
+        global _last_ingested_fingerprint
+
         start_time = datetime.now()
-        logger.info("=" * 70)
-        logger.info("Starting Data Ingestion Pipeline")
-        logger.info(f"Timestamp: {start_time.isoformat()}")
-        logger.info("=" * 70)
+        logger.info(
+            "\n".join([
+                "=" * 70,
+                "Starting Data Ingestion Pipeline",
+                f"Timestamp: {start_time.isoformat()}",
+                "=" * 70,
+            ])
+        )
 
         try:
             # Step 1: Scrape documents
             self._scrape_documents()
+            source_counts = self._count_documents_by_source()
+
+            # Nothing changed since the last run: skip chunking and embedding
+            fingerprint = fingerprint_documents(self.documents)
+            if self._already_ingested(fingerprint):
+                logger.info("Documents unchanged since last ingestion, skipping chunking and storage")
+                return IngestionStats(
+                    run_timestamp=start_time.isoformat(),
+                    documents_loaded=len(self.documents),
+                    **source_counts,
+                    chunks_created=0,
+                    chunks_embedded=0,
+                    chunks_stored=0,
+                    errors=len(self.errors),
+                    duration_seconds=(datetime.now() - start_time).total_seconds(),
+                    success=len(self.errors) == 0
+                )
 
             # Step 2: Chunk documents
             self._chunk_documents()
@@ -115,9 +178,7 @@ class DataIngestionPipeline:
             stats = IngestionStats(
                 run_timestamp=start_time.isoformat(),
                 documents_loaded=len(self.documents),
-                manual_documents=sum(1 for d in self.documents if d.get('metadata', {}).get('document_type') == 'manual'),
-                govuk_documents=sum(1 for d in self.documents if d.get('metadata', {}).get('source') == 'gov.uk' and d.get('metadata', {}).get('document_type') == 'scraped'),
-                opora_documents=sum(1 for d in self.documents if d.get('metadata', {}).get('source') == 'opora.uk' and d.get('metadata', {}).get('document_type') == 'scraped'),
+                **source_counts,
                 chunks_created=len(self.chunks),
                 chunks_embedded=len(self.chunks),
                 chunks_stored=len(self.chunks),
@@ -126,16 +187,24 @@ class DataIngestionPipeline:
                 success=len(self.errors) == 0
             )
 
-            logger.info("=" * 70)
-            logger.info("Ingestion Pipeline Completed Successfully")
-            logger.info(f"Documents loaded: {stats.documents_loaded}")
-            logger.info(f"  - Manual: {stats.manual_documents}")
-            logger.info(f"  - Gov.uk: {stats.govuk_documents}")
-            logger.info(f"  - Opora.uk: {stats.opora_documents}")
-            logger.info(f"Chunks created: {stats.chunks_created}")
-            logger.info(f"Chunks stored: {stats.chunks_stored}")
-            logger.info(f"Duration: {stats.duration_seconds:.2f} seconds")
-            logger.info("=" * 70)
+            if stats.success:
+                _last_ingested_fingerprint = fingerprint
+
+            # One record for the whole summary instead of one per line
+            logger.info(
+                "\n".join([
+                    "=" * 70,
+                    "Ingestion Pipeline Completed Successfully",
+                    f"Documents loaded: {stats.documents_loaded}",
+                    f"  - Manual: {stats.manual_documents}",
+                    f"  - Gov.uk: {stats.govuk_documents}",
+                    f"  - Opora.uk: {stats.opora_documents}",
+                    f"Chunks created: {stats.chunks_created}",
+                    f"Chunks stored: {stats.chunks_stored}",
+                    f"Duration: {stats.duration_seconds:.2f} seconds",
+                    "=" * 70,
+                ])
+            )
 
             return stats
 
@@ -159,43 +228,72 @@ class DataIngestionPipeline:
                 success=False
             )
 
+    def _count_documents_by_source(self) -> Dict[str, int]:
+        """
+        Count loaded documents per source for IngestionStats.
+
+        Returns:
+            manual_documents, govuk_documents and opora_documents counts
+        """
+        metadata = [d.get('metadata', {}) for d in self.documents]
+        return {
+            "manual_documents": sum(1 for m in metadata if m.get('document_type') == 'manual'),
+            "govuk_documents": sum(1 for m in metadata if m.get('source') == 'gov.uk' and m.get('document_type') == 'scraped'),
+            "opora_documents": sum(1 for m in metadata if m.get('source') == 'opora.uk' and m.get('document_type') == 'scraped'),
+        }
+
+    def _already_ingested(self, fingerprint: int) -> bool:
+        """
+        Check whether these exact documents were already stored by this process.
+
+        Args:
+            fingerprint: Fingerprint of the freshly loaded documents
+
+        Returns:
+            True if ingestion can be skipped
+        """
+        if self.recreate_collection or fingerprint != _last_ingested_fingerprint:
+            return False
+
+        # Make sure the stored points are still there
+        if not self.vector_store.connect():
+            return False
+
+        info = self.vector_store.get_collection_info()
+        return bool(info and info["points_count"])
+
     def _scrape_documents(self):
         """Step 1: Load documents from sources (manual files or scrapers)."""
         logger.info("Step 1: Loading documents from sources...")
 
-        manual_docs = []
-        govuk_docs = []
-        opora_docs = []
-
-        # Load manual documents
+        # Enabled sources: name -> (loader, error message prefix)
+        sources = {}
         if self.use_manual_docs:
-            try:
-                logger.info("Loading manual documents...")
-                manual_docs = load_manual_documents()
-                logger.info(f"Loaded {len(manual_docs)} manual documents")
-            except Exception as e:
-                logger.error(f"Failed to load manual documents: {e}")
-                self.errors.append(f"Manual documents loading error: {str(e)}")
-
-        # Scrape gov.uk (only if enabled)
+            sources["manual"] = (load_manual_documents, "Manual documents loading error")
         if self.scrape_govuk_enabled:
-            try:
-                logger.info("Scraping gov.uk...")
-                govuk_docs = scrape_govuk()
-                logger.info(f"Scraped {len(govuk_docs)} documents from gov.uk")
-            except Exception as e:
-                logger.error(f"Failed to scrape gov.uk: {e}")
-                self.errors.append(f"gov.uk scraping error: {str(e)}")
-
-        # Scrape opora.uk (only if enabled)
+            sources["gov.uk"] = (scrape_govuk, "gov.uk scraping error")
         if self.scrape_opora_enabled:
-            try:
-                logger.info("Scraping opora.uk...")
-                opora_docs = scrape_opora()
-                logger.info(f"Scraped {len(opora_docs)} documents from opora.uk")
-            except Exception as e:
-                logger.error(f"Failed to scrape opora.uk: {e}")
-                self.errors.append(f"opora.uk scraping error: {str(e)}")
+            sources["opora.uk"] = (scrape_opora, "opora.uk scraping error")
+
+        # Sources are independent and I/O-bound (disk, different sites),
+        # so load them concurrently instead of one after another
+        loaded: Dict[str, List[Dict[str, Any]]] = {}
+        if sources:
+            logger.info(f"Loading from: {', '.join(sources)}")
+            with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+                futures = {name: executor.submit(loader) for name, (loader, _) in sources.items()}
+
+            for name, future in futures.items():
+                try:
+                    loaded[name] = future.result()
+                    logger.info(f"Loaded {len(loaded[name])} documents from {name}")
+                except Exception as e:
+                    logger.error(f"Failed to load {name} documents: {e}")
+                    self.errors.append(f"{sources[name][1]}: {str(e)}")
+
+        manual_docs = loaded.get("manual", [])
+        govuk_docs = loaded.get("gov.uk", [])
+        opora_docs = loaded.get("opora.uk", [])
 
         # Combine all documents
         self.documents = manual_docs + govuk_docs + opora_docs
@@ -327,6 +425,20 @@ class DataIngestionPipeline:
         Args:
             directory: Directory to save documents
         """
+        global _last_saved_fingerprint
+
+        # Nothing was chunked (e.g. the run was skipped as unchanged): an
+        # empty chunks file would not match the documents saved next to it
+        if not self.chunks:
+            logger.info("No chunks in this run, skipping artifacts")
+            return
+
+        # Same documents as the last saved artifacts: don't write a duplicate copy
+        fingerprint = fingerprint_documents(self.documents)
+        if fingerprint == _last_saved_fingerprint:
+            logger.info("Documents unchanged since last save, skipping artifacts")
+            return
+
         output_dir = Path(directory)
         output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -334,19 +446,19 @@ class DataIngestionPipeline:
 
         # Save documents
         docs_file = output_dir / f"documents_{timestamp}.json"
-        with open(docs_file, 'w', encoding='utf-8') as f:
-            json.dump(self.documents, f, indent=2, ensure_ascii=False)
+        _write_json(docs_file, self.documents)
 
         logger.info(f"Saved {len(self.documents)} documents to {docs_file}")
 
         # Save chunks
         chunks_data = [chunk.to_dict() for chunk in self.chunks]
         chunks_file = output_dir / f"chunks_{timestamp}.json"
-        with open(chunks_file, 'w', encoding='utf-8') as f:
-            json.dump(chunks_data, f, indent=2, ensure_ascii=False)
+        _write_json(chunks_file, chunks_data)
 
         logger.info(f"Saved {len(self.chunks)} chunks to {chunks_file}")
 
+        _last_saved_fingerprint = fingerprint
+
 
 def run_ingestion(
     use_manual_docs: Optional[bool] = None,
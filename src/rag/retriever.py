@@ -12,7 +12,7 @@ from src.utils.datetime_utils import get_current_datetime_online, parse_document
 logger = get_logger()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RetrievalResult:
     """Result from RAG retrieval."""
     context: str
@@ -93,7 +93,7 @@ class RAGRetriever:
                 if not self.initialize():
                     return self._empty_result(query)
 
-            logger.info(f"Retrieving documents for query: '{query[:50]}...'")
+            logger.info("Retrieving documents for query: '{}...'", query[:50])
 
             # Prepare filter conditions
             filter_conditions = {}
@@ -136,8 +136,8 @@ class RAGRetriever:
                 for res in results
             ]
 
-            logger.info(f"Retrieved {len(results)} documents, "
-                       f"context length: {len(context)} characters")
+            logger.info("Retrieved {} documents, context length: {} characters",
+                        len(results), len(context))
 
             return RetrievalResult(
                 context=context,
@@ -180,12 +180,12 @@ class RAGRetriever:
                     if days_old <= max_age_days:
                         filtered_results.append(result)
                     else:
-                        logger.debug(f"Filtered out document (age: {days_old} days): {metadata.get('title', 'Unknown')}")
+                        logger.debug("Filtered out document (age: {} days): {}", days_old, metadata.get('title', 'Unknown'))
                 else:
                     # If date can't be parsed, keep the document
                     filtered_results.append(result)
 
-            logger.info(f"Filtered {len(results)} documents to {len(filtered_results)} (max_age_days={max_age_days})")
+            logger.info("Filtered {} documents to {} (max_age_days={})", len(results), len(filtered_results), max_age_days)
             return filtered_results
 
         except Exception as e:
@@ -216,7 +216,7 @@ class RAGRetriever:
 
         try:
             sorted_results = sorted(results, key=get_sort_key, reverse=True)
-            logger.debug(f"Sorted {len(results)} documents by date")
+            logger.debug("Sorted {} documents by date", len(results))
             return sorted_results
         except Exception as e:
             logger.error(f"Failed to sort by date: {e}")
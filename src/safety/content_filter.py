@@ -11,15 +11,15 @@ logger = get_logger()
 class ContentFilter:
     """Filters inappropriate or off-topic content."""
 
-    # Patterns that might indicate spam
-    SPAM_PATTERNS = [
+    # Patterns that might indicate spam (compiled once, matched per message)
+    SPAM_PATTERNS = tuple(re.compile(pattern) for pattern in (
         r"(buy|cheap|discount|sale|offer).*\$\d+",
         r"click here.*http",
         r"http://bit\.ly",
         r"free money",
         r"win \$",
         r"urgent.*click",
-    ]
+    ))
 
     # Maximum allowed message length
     MAX_MESSAGE_LENGTH = 4096  # Telegram limit
@@ -40,8 +40,8 @@ class ContentFilter:
         text_lower = text.lower()
 
         for pattern in self.SPAM_PATTERNS:
-            if re.search(pattern, text_lower):
-                logger.warning(f"Spam pattern detected: {pattern}")
+            if pattern.search(text_lower):
+                logger.warning(f"Spam pattern detected: {pattern.pattern}")
                 return True
 
         return False
@@ -1,5 +1,6 @@
 """Response validation for safety and compliance."""
 
+from dataclasses import replace
 from typing import Tuple, List
 
 from src.agents.base_agent import AgentResponse
@@ -15,16 +16,16 @@ class ResponseValidator:
     """Validates agent responses for safety and compliance."""
 
     # Required disclaimer keywords (at least one must be present)
-    REQUIRED_DISCLAIMER_KEYWORDS = [
+    REQUIRED_DISCLAIMER_KEYWORDS = (
         "не юридична консультація",
         "не є юристом",
         "зверніться до спеціаліста",
         "це загальна інформація",
         "не фінансова консультація"
-    ]
+    )
 
     # Prohibited phrases that indicate illegal legal predictions
-    PROHIBITED_PHRASES = [
+    PROHIBITED_PHRASES = (
         "ви точно отримаєте",
         "вам гарантовано",
         "100% схвалення",
@@ -33,7 +34,10 @@ class ResponseValidator:
         "точно схвалять",
         "обов'язково отримаєте",
         "без сумніву отримаєте"
-    ]
+    )
+
+    # Languages accepted as Ukrainian-compatible output
+    ACCEPTED_LANGUAGES = frozenset({"uk", "ru"})
 
     def __init__(self):
         """Initialize response validator."""
@@ -69,8 +73,8 @@ class ResponseValidator:
             if not has_disclaimer and self.settings.enable_safety_disclaimers:
                 # Add appropriate disclaimer
                 disclaimer = get_disclaimer(response.agent_name)
-                response.text += disclaimer
-                logger.info(f"{response.agent_name}: Added missing disclaimer")
+                response = replace(response, text=response.text + disclaimer)
+                logger.info("{}: Added missing disclaimer", response.agent_name)
 
             # Check 3: Must not have prohibited legal predictions
             has_prohibited = any(
@@ -90,7 +94,7 @@ class ResponseValidator:
                 logger.warning(f"{response.agent_name}: Response has no sources")
                 # Still valid, just log it
 
-            logger.info(f"{response.agent_name}: Response validation passed")
+            logger.info("{}: Response validation passed", response.agent_name)
             return is_valid, response
 
         except Exception as e:
@@ -112,7 +116,7 @@ class ResponseValidator:
 
         # Accept both Ukrainian and Russian (since we support both input languages)
         # Also accept unknown if it's mostly Cyrillic
-        if detected in ["uk", "ru"]:
+        if detected in self.ACCEPTED_LANGUAGES:
             return True
 
         # Check if mostly Cyrillic as fallback
@@ -28,6 +28,7 @@ class Settings(BaseSettings):
     qdrant_host: str = "localhost"
     qdrant_port: int = 6333
     qdrant_collection_name: str = "ukraine_support_knowledge"
+    qdrant_vector_datatype: Literal["float32", "float16"] = "float32"
 
     # RAG Configuration
     rag_chunk_size: int = 500
@@ -61,6 +62,7 @@ class Settings(BaseSettings):
     scraper_user_agent: str = "Mozilla/5.0 (compatible; UkraineSupportBot/1.0)"
     scraper_request_delay_seconds: int = 2
     scraper_max_retries: int = 3
+    scraper_cache_max_entries: int = 5000  # Maximum cached pages (W-TinyLFU eviction)
 
     # Pagination Configuration
     scraper_pagination_enabled: bool = True  # Enable pagination for multi-page scraping
@@ -83,6 +85,7 @@ class Settings(BaseSettings):
     log_file_path: str = "/app/logs/bot.log"
     log_max_size_mb: int = 100
     log_backup_count: int = 5
+    log_enqueue: bool = False  # Hand records to a background writer thread
 
     # Safety Configuration
     enable_safety_disclaimers: bool = True
@@ -2,6 +2,7 @@
 
 import requests
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 from src.utils.logger import get_logger
 
@@ -71,6 +72,7 @@ def get_current_date_str(format: str = "%Y-%m-%d") -> str:
         return datetime.now().strftime(format)
 
 
+@lru_cache(maxsize=4096)
 def parse_document_date(date_str: str) -> Optional[datetime]:
     """
     Parse a document date string to datetime object.
@@ -89,6 +91,16 @@ def parse_document_date(date_str: str) -> Optional[datetime]:
     if not date_str:
         return None
 
+    date_str_naive = date_str.split('+')[0].split('Z')[0]
+
+    # Fast path for ISO dates, which is what the loaders store.
+    # Any offset left over (e.g. "-05:00") is dropped like "+"/"Z" above:
+    # callers compare against naive datetimes.
+    try:
+        return datetime.fromisoformat(date_str_naive).replace(tzinfo=None)
+    except ValueError:
+        pass
+
     # Try different date formats
     formats = [
         "%Y-%m-%dT%H:%M:%S",  # ISO with time
@@ -100,7 +112,7 @@ def parse_document_date(date_str: str) -> Optional[datetime]:
 
     for fmt in formats:
         try:
-            return datetime.strptime(date_str.split('+')[0].split('Z')[0], fmt)
+            return datetime.strptime(date_str_naive, fmt)
         except ValueError:
             continue
 
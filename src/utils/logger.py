@@ -1,5 +1,6 @@
 """Logging configuration using loguru."""
 
+import os
 import sys
 from pathlib import Path
 from loguru import logger
@@ -11,9 +12,19 @@ def setup_logger():
     """Configure application logging using loguru.
 
     Sets up both file and console logging based on configuration.
+    With LOG_ENQUEUE=true, records are handed to a background thread so
+    logging calls don't block on the sinks.
+    Tracebacks are rendered without loguru's variable-value annotations
+    (diagnose), which are slow to build and can leak secrets into logs.
+    Under CI (CI env var set) the level defaults to WARNING unless
+    LOG_LEVEL is given explicitly (environment or .env file).
     """
     settings = get_settings()
 
+    level = settings.log_level
+    if os.environ.get("CI") and "log_level" not in settings.model_fields_set:
+        level = "WARNING"
+
     # Remove default handler
     logger.remove()
 
@@ -28,7 +39,9 @@ def setup_logger():
     logger.add(
         sys.stdout,
         format=console_format,
-        level=settings.log_level,
+        level=level,
+        enqueue=settings.log_enqueue,
+        diagnose=False,
         colorize=True,
     )
 
@@ -41,7 +54,9 @@ def setup_logger():
         logger.add(
             log_path,
             format=file_format,
-            level=settings.log_level,
+            level=level,
+            enqueue=settings.log_enqueue,
+            diagnose=False,
             rotation=f"{settings.log_max_size_mb} MB",
             retention=settings.log_backup_count,
             serialize=True,  # JSON output
@@ -54,12 +69,14 @@ def setup_logger():
         logger.add(
             log_path,
             format=file_format,
-            level=settings.log_level,
+            level=level,
+            enqueue=settings.log_enqueue,
+            diagnose=False,
             rotation=f"{settings.log_max_size_mb} MB",
             retention=settings.log_backup_count,
         )
 
-    logger.info(f"Logger initialized with level: {settings.log_level}")
+    logger.info(f"Logger initialized with level: {level}")
     logger.info(f"Logging to file: {log_path}")
 
     return logger
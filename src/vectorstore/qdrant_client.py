@@ -2,7 +2,7 @@
 
 from typing import List, Dict, Any, Optional
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct, Filter
+from qdrant_client.models import Batch, Datatype, Distance, VectorParams, Filter
 from qdrant_client.http import models
 import ollama
 
@@ -85,7 +85,8 @@ class QdrantVectorStore:
                 collection_name=self.collection_name,
                 vectors_config=VectorParams(
                     size=vector_size,
-                    distance=Distance.COSINE
+                    distance=Distance.COSINE,
+                    datatype=Datatype(self.settings.qdrant_vector_datatype)
                 )
             )
 
@@ -109,7 +110,7 @@ class QdrantVectorStore:
             List of floats representing the embedding, or None if failed
         """
         try:
-            logger.debug(f"Generating embedding for text (length: {len(text)})")
+            logger.debug("Generating embedding for text (length: {})", len(text))
 
             # Use ollama library to generate embeddings
             response = self.ollama_client.embeddings(
@@ -120,7 +121,7 @@ class QdrantVectorStore:
             embedding = response.get("embedding")
 
             if embedding:
-                logger.debug(f"Successfully generated embedding (size: {len(embedding)})")
+                logger.debug("Successfully generated embedding (size: {})", len(embedding))
 
                 # Cache vector size
                 if not self._vector_size:
@@ -156,7 +157,9 @@ class QdrantVectorStore:
 
             logger.info(f"Adding {len(documents)} documents to collection '{self.collection_name}'")
 
-            points = []
+            ids: List[int] = []
+            vectors: List[List[float]] = []
+            payloads: List[Dict[str, Any]] = []
 
             for idx, doc in enumerate(documents):
                 text = doc.get("text", "")
@@ -173,34 +176,23 @@ class QdrantVectorStore:
                     logger.warning(f"Failed to generate embedding for document {idx}, skipping")
                     continue
 
-                # Create point
-                point = PointStruct(
-                    id=idx,
-                    vector=embedding,
-                    payload={
-                        "text": text,
-                        **metadata
-                    }
-                )
-
-                points.append(point)
+                ids.append(idx)
+                vectors.append(embedding)
+                payloads.append({
+                    "text": text,
+                    **metadata
+                })
 
                 # Upload in batches
-                if len(points) >= batch_size:
-                    self.client.upsert(
-                        collection_name=self.collection_name,
-                        points=points
-                    )
-                    logger.info(f"Uploaded batch of {len(points)} points")
-                    points = []
+                if len(ids) >= batch_size:
+                    self._upsert_batch(ids, vectors, payloads)
+                    logger.info(f"Uploaded batch of {len(ids)} points")
+                    ids, vectors, payloads = [], [], []
 
             # Upload remaining points
-            if points:
-                self.client.upsert(
-                    collection_name=self.collection_name,
-                    points=points
-                )
-                logger.info(f"Uploaded final batch of {len(points)} points")
+            if ids:
+                self._upsert_batch(ids, vectors, payloads)
+                logger.info(f"Uploaded final batch of {len(ids)} points")
 
             logger.info(f"Successfully added all documents to collection")
             return True
@@ -209,6 +201,32 @@ class QdrantVectorStore:
             logger.error(f"Failed to add documents: {e}")
             return False
 
+    def _upsert_batch(
+        self,
+        ids: List[int],
+        vectors: List[List[float]],
+        payloads: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Upload one batch of points in column-oriented form.
+
+        IDs, vectors and payloads are sent as parallel lists instead of
+        building a PointStruct per document.
+
+        Args:
+            ids: Point IDs
+            vectors: Embeddings, one per ID
+            payloads: Payloads, one per ID
+        """
+        self.client.upsert(
+            collection_name=self.collection_name,
+            points=Batch(
+                ids=ids,
+                vectors=vectors,
+                payloads=payloads
+            )
+        )
+
     def search(
         self,
         query: str,
@@ -236,7 +254,7 @@ class QdrantVectorStore:
             top_k = top_k or self.settings.rag_top_k_results
             score_threshold = score_threshold or self.settings.rag_similarity_threshold
 
-            logger.info(f"Searching for: '{query[:50]}...' (top_k={top_k}, threshold={score_threshold})")
+            logger.info("Searching for: '{}...' (top_k={}, threshold={})", query[:50], top_k, score_threshold)
 
             # Generate query embedding
             query_embedding = self.get_embedding(query)
@@ -282,7 +300,7 @@ class QdrantVectorStore:
                     "id": result.id
                 })
 
-            logger.info(f"Found {len(results)} results")
+            logger.info("Found {} results", len(results))
 
             return results
 
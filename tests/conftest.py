@@ -0,0 +1,37 @@
+"""Shared pytest fixtures."""
+
+import asyncio
+import functools
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (not available on Windows)
+    uvloop = None
+
+# Run async tests on uvloop's libuv-based event loop when available
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+@pytest.fixture(scope="session")
+def warm_vs():
+    """
+    Connected vector store shared by the whole test session.
+
+    The embedding model is warmed up once and embeddings are memoized, so
+    tests embedding the same text don't pay for Ollama inference again.
+    The connection is probed once; without a reachable Qdrant every test
+    using this fixture is skipped instead of failing on its own timeout.
+    """
+    from src.vectorstore.qdrant_client import get_vector_store
+
+    vs = get_vector_store()
+    if not vs.connect():
+        pytest.skip("Qdrant is not available")
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(vs, "get_embedding", functools.lru_cache(maxsize=1024)(vs.get_embedding))
+        vs.get_embedding("warmup")
+        yield vs
@@ -2,8 +2,6 @@
 """Test embedding model with Ukrainian text."""
 
 import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent))
 
 import ollama
 from src.utils.config import get_settings
@@ -21,7 +19,6 @@ def test_ukrainian_embedding():
     ]
 
     print(f"Testing embedding model: {settings.ollama_embedding_model}")
-    print("=" * 70)
 
     for i, text in enumerate(test_cases, 1):
         print(f"\nTest {i}: {text}")
@@ -46,8 +43,7 @@ def test_ukrainian_embedding():
             print(f"❌ ERROR: {e}")
             return False
 
-    print("\n" + "=" * 70)
-    print("✅ All tests passed!")
+    print("\n✅ All tests passed!")
     return True
 
 if __name__ == "__main__":
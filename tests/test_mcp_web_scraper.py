@@ -2,16 +2,30 @@
 
 import pytest
 import asyncio
+from datetime import datetime
 from pathlib import Path
-import sys
 
-# Add mcp-servers to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "mcp-servers" / "web-scraper"))
+import msgspec
 
-from scrapers.base_scraper import BaseWebScraper, RobotsChecker, RateLimiter, ContentCache
+from scrapers.base_scraper import BaseWebScraper, RobotsChecker, RateLimiter, ContentCache, ScrapedContent
 from scrapers.opora_scraper import OporaUkScraper
 from scrapers.govuk_scraper import GovUkScraper
 
+# Prototype for cache tests; variants are derived with make_content()
+_DEFAULT_CONTENT = ScrapedContent(
+    url="https://test.com/page",
+    title="Test Page",
+    content="Test content",
+    links=[],
+    metadata={},
+    scraped_at=datetime.now()
+)
+
+
+def make_content(**overrides) -> ScrapedContent:
+    """Create test content, overriding only the given fields."""
+    return msgspec.structs.replace(_DEFAULT_CONTENT, **overrides)
+
 
 class TestRobotsChecker:
     """Test robots.txt compliance checker."""
@@ -67,25 +81,17 @@ class TestRateLimiter:
 class TestContentCache:
     """Test content caching."""
 
-    def test_cache_set_and_get(self, tmp_path):
+    @pytest.fixture
+    def cache_dir(self, fs):
+        """Cache directory on an in-memory filesystem (pyfakefs)."""
+        return Path("/cache")
+
+    def test_cache_set_and_get(self, cache_dir):
         """Test caching and retrieval of content."""
-        from scrapers.base_scraper import ScrapedContent
-        from datetime import datetime
-
-        cache = ContentCache(str(tmp_path), default_ttl=3600)
-
-        # Create test content
-        content = ScrapedContent(
-            url="https://test.com/page",
-            title="Test Page",
-            content="Test content",
-            links=[],
-            metadata={},
-            scraped_at=datetime.now()
-        )
+        cache = ContentCache(str(cache_dir), default_ttl=3600)
 
-        # Cache it
-        cache.set(content)
+        # Cache test content
+        cache.set(make_content())
 
         # Retrieve it
         retrieved = cache.get("https://test.com/page")
@@ -94,33 +100,116 @@ class TestContentCache:
         assert retrieved.title == "Test Page"
         assert retrieved.content == "Test content"
         assert retrieved.cached is True
+        assert not list(cache_dir.glob("*.tmp"))
 
-    def test_cache_expiration(self, tmp_path):
+    def test_cache_expiration(self, cache_dir):
         """Test that expired cache entries return None."""
-        from scrapers.base_scraper import ScrapedContent
-        from datetime import datetime
+        import os
         import time
 
-        cache = ContentCache(str(tmp_path), default_ttl=1)  # 1 second TTL
-
-        content = ScrapedContent(
-            url="https://test.com/page",
-            title="Test",
-            content="Test",
-            links=[],
-            metadata={},
-            scraped_at=datetime.now()
-        )
+        cache = ContentCache(str(cache_dir), default_ttl=1)  # 1 second TTL
 
-        cache.set(content)
+        cache.set(make_content(title="Test", content="Test"))
 
-        # Wait for expiration
-        time.sleep(2)
+        # Age the entry past its TTL instead of sleeping
+        for cache_file in cache_dir.glob("*.json"):
+            expired = time.time() - 2
+            os.utime(cache_file, (expired, expired))
 
         # Should be expired
         retrieved = cache.get("https://test.com/page")
         assert retrieved is None
 
+    def test_cache_max_entries(self, cache_dir):
+        """Test that a bounded cache keeps popular pages over one-off ones."""
+        cache = ContentCache(str(cache_dir), default_ttl=3600, max_entries=10)
+
+        hot_url = "https://test.com/hot"
+        cache.set(make_content(url=hot_url))
+        for _ in range(5):
+            assert cache.get(hot_url) is not None
+
+        # Scan of one-hit pages
+        for i in range(50):
+            url = f"https://test.com/page{i}"
+            cache.get(url)
+            cache.set(make_content(url=url))
+
+        assert len(list(cache_dir.glob("*.json"))) <= 10
+        assert cache.get(hot_url) is not None
+
+    def test_cache_keeps_newest_entries_on_startup(self, cache_dir):
+        """Test that reopening a full cache directory keeps the newest pages."""
+        import os
+        import time
+
+        unbounded = ContentCache(str(cache_dir), default_ttl=3600)
+        urls = [f"https://test.com/page{i}" for i in range(30)]
+        now = time.time()
+        for i, url in enumerate(urls):
+            unbounded.set(make_content(url=url))
+            # Staggered mtimes: page0 is the oldest, page29 the newest
+            written = now - (len(urls) - i) * 60
+            os.utime(unbounded._get_cache_path(unbounded._get_cache_key(url)), (written, written))
+
+        cache = ContentCache(str(cache_dir), default_ttl=3600, max_entries=10)
+
+        survivors = {path.stem for path in cache_dir.glob("*.json")}
+        assert survivors == {cache._get_cache_key(url) for url in urls[-10:]}
+        assert len(cache.policy) == 10
+
+    def test_cache_shared_between_scrapers(self, cache_dir):
+        """Test that scrapers sharing a cache directory share its eviction policy."""
+        cache = ContentCache(str(cache_dir), default_ttl=3600, max_entries=10)
+        opora = OporaUkScraper(user_agent="TestBot/1.0", cache_dir=str(cache_dir), cache=cache, respect_robots=False)
+        govuk = GovUkScraper(user_agent="TestBot/1.0", cache_dir=str(cache_dir), cache=cache, respect_robots=False)
+
+        assert opora.cache is govuk.cache
+
+        hot_url = "https://test.com/hot"
+        opora.cache.set(make_content(url=hot_url))
+        for _ in range(5):
+            assert opora.cache.get(hot_url) is not None
+
+        # One-off pages written by the other scraper
+        for i in range(50):
+            url = f"https://test.com/page{i}"
+            govuk.cache.get(url)
+            govuk.cache.set(make_content(url=url))
+
+        assert len(list(cache_dir.glob("*.json"))) <= 10
+        assert opora.cache.get(hot_url) is not None
+
+
+class TestWTinyLFU:
+    """Test W-TinyLFU eviction policy."""
+
+    def test_capacity_is_respected(self):
+        """Test that evicted keys keep the policy within capacity."""
+        from scrapers._wtinylfu import WTinyLFU
+
+        policy = WTinyLFU(capacity=20)
+        for i in range(100):
+            policy.record_access(i)
+            policy.add(i)
+
+        assert len(policy) == 20
+
+    def test_frequent_key_survives_scan(self):
+        """Test that a frequently accessed key is not evicted by a scan."""
+        from scrapers._wtinylfu import WTinyLFU
+
+        policy = WTinyLFU(capacity=20)
+        policy.add("hot")
+        for _ in range(10):
+            policy.record_access("hot")
+
+        for i in range(200):
+            policy.record_access(f"cold{i}")
+            policy.add(f"cold{i}")
+
+        assert "hot" in policy
+
 
 class TestBaseWebScraper:
     """Test base web scraper functionality."""
@@ -241,6 +330,14 @@ class TestGovUkScraper:
         assert title == "Housing for Ukraine"
         assert "GOV.UK" not in title
 
+    def test_extract_title_from_title_tag(self, scraper):
+        """Test that suffix variants are stripped from the <title> fallback."""
+        from bs4 import BeautifulSoup
+
+        for raw in ["Council housing - GOV.UK", "Council housing | GOV.UK"]:
+            soup = BeautifulSoup(f"<html><head><title>{raw}</title></head></html>", 'lxml')
+            assert scraper._extract_title(soup, soup) == "Council housing"
+
 
 @pytest.mark.asyncio
 class TestMCPClient:
@@ -16,18 +16,14 @@ Options:
 
 import sys
 import argparse
-from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
+import pytest
 
 from src.rag.chunker import DocumentChunker, ChunkingStrategy
 from src.rag.retriever import RAGRetriever
 from src.vectorstore.qdrant_client import QdrantVectorStore
 from src.utils.logger import setup_logger, get_logger
 
-# Initialize logger
-setup_logger()
 logger = get_logger()
 
 
@@ -40,8 +36,6 @@ def print_section(title):
 
 def test_chunking():
     """Test document chunking."""
-    print_section("TEST 1: Document Chunking")
-
     chunker = DocumentChunker(chunk_size=300, chunk_overlap=50)
 
     # Test documents (Ukrainian content)
@@ -81,15 +75,19 @@ def test_chunking():
     return chunks
 
 
-def test_vector_store(chunks):
-    """Test vector store operations."""
-    print_section("TEST 2: Vector Store Operations")
+@pytest.fixture
+def chunks():
+    """Chunks produced by the chunking step."""
+    return test_chunking()
+
 
-    vector_store = QdrantVectorStore()
+def test_vector_store(chunks, warm_vs):
+    """Test vector store operations."""
+    vector_store = warm_vs
 
     # Connect
     print("Connecting to Qdrant...")
-    if not vector_store.connect():
+    if not vector_store.client:
         print("✗ Failed to connect to Qdrant")
         return False
 
@@ -142,8 +140,6 @@ def test_vector_store(chunks):
 
 def test_retrieval():
     """Test document retrieval."""
-    print_section("TEST 3: Document Retrieval")
-
     retriever = RAGRetriever()
 
     # Initialize
@@ -209,7 +205,9 @@ def test_full_pipeline():
             return False
 
         # Test 2: Vector Store
-        if test_vector_store(chunks):
+        vector_store = QdrantVectorStore()
+        vector_store.connect()
+        if test_vector_store(chunks, vector_store):
             success_count += 1
         else:
             print("\n✗ Vector store test failed")
@@ -292,6 +290,8 @@ def main():
 
     args = parser.parse_args()
 
+    setup_logger()
+
     print("\n" + "=" * 70)
     print("  RAG PIPELINE END-TO-END TEST")
     print("=" * 70)
@@ -1,18 +1,13 @@
 #!/usr/bin/env python3
 """Test to see actual similarity scores without threshold filtering."""
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from src.vectorstore.qdrant_client import get_vector_store
 from src.utils.config import get_settings
 
-def test_scores():
+def test_scores(warm_vs):
     """Test similarity scores for Ukrainian query."""
     settings = get_settings()
-    vs = get_vector_store()
-    vs.connect()
+    vs = warm_vs
 
     # Test query
     query = "Що ти можеш порадити мені робити з моєю візою після прибуття?"
@@ -55,4 +50,6 @@ def test_scores():
     print(f"Current threshold setting: {settings.rag_similarity_threshold}")
 
 if __name__ == "__main__":
-    test_scores()
+    vs = get_vector_store()
+    vs.connect()
+    test_scores(vs)
@@ -3,6 +3,71 @@
 import pytest
 from src.rag.chunker import DocumentChunker, ChunkingStrategy, TextChunk
 
+UKR_SENTENCES = (
+    "Це перше речення про візи до Великобританії. "
+    "Це друге речення про імміграційні правила. "
+    "Це третє речення про документи. "
+    "Це четверте речення про процедуру подачі заяви."
+)
+
+UKR_PARAGRAPHS = """Перший абзац містить інформацію про візи.
+Він може бути досить довгим і детальним.
+
+Другий абзац розповідає про житло.
+Тут є корисні поради для іммігрантів.
+
+Третій абзац про роботу та навчання.
+Важлива інформація для новоприбулих."""
+
+# Very long sentence without punctuation
+UKR_LONG_SENTENCE = "Це дуже довге речення без жодних розділових знаків яке має бути розділене на частини " * 5
+
+UKR_SHORT_SENTENCES = (
+    "Перше речення тексту. "
+    "Друге речення тексту. "
+    "Третє речення тексту. "
+    "Четверте речення тексту. "
+    "П'яте речення тексту. "
+    "Шосте речення тексту."
+)
+
+
+# (strategy, chunk_size, chunk_overlap, text, expected invariants)
+CHUNKING_CASES = [
+    pytest.param(
+        ChunkingStrategy.FIXED, 50, 10, "A" * 120,
+        {"min_chunks": 2, "max_len": 50},
+        id="fixed"
+    ),
+    pytest.param(
+        ChunkingStrategy.SENTENCE, 200, 50, UKR_SENTENCES,
+        {"no_trailing": "про"},
+        id="sentence-ukrainian"
+    ),
+    pytest.param(
+        ChunkingStrategy.PARAGRAPH, 300, 50, UKR_PARAGRAPHS,
+        {},
+        id="paragraph"
+    ),
+    pytest.param(
+        ChunkingStrategy.SENTENCE, 100, 20, UKR_LONG_SENTENCE,
+        {"min_chunks": 2, "max_len": 120},  # Some tolerance for word boundaries
+        id="long-sentence"
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def chunker():
+    """Chunker with 500/50 size/overlap, shared by tests in this module."""
+    return DocumentChunker(chunk_size=500, chunk_overlap=50)
+
+
+@pytest.fixture(scope="module")
+def small_chunker():
+    """Chunker with 100/20 size/overlap, shared by tests in this module."""
+    return DocumentChunker(chunk_size=100, chunk_overlap=20)
+
 
 class TestDocumentChunker:
     """Test cases for DocumentChunker."""
@@ -19,88 +84,37 @@ class TestDocumentChunker:
         with pytest.raises(ValueError):
             DocumentChunker(chunk_size=100, chunk_overlap=100)
 
-    def test_clean_text(self):
+    def test_clean_text(self, chunker):
         """Test text cleaning functionality."""
-        chunker = DocumentChunker(chunk_size=500, chunk_overlap=50)
-
         # Test whitespace normalization
         text = "Multiple    spaces   and\n\n\n\nmultiple newlines"
         cleaned = chunker._clean_text(text)
         assert "    " not in cleaned
         assert "\n\n\n" not in cleaned
 
-    def test_chunk_fixed_strategy(self):
-        """Test fixed-size chunking."""
-        chunker = DocumentChunker(
-            chunk_size=50,
-            chunk_overlap=10,
-            strategy=ChunkingStrategy.FIXED
-        )
-
-        text = "A" * 120  # 120 characters
-        chunks = chunker.chunk_text(text)
-
-        assert len(chunks) > 1
-        assert all(len(chunk.text) <= 50 for chunk in chunks)
-
-    def test_chunk_by_sentences_ukrainian(self):
-        """Test sentence-aware chunking with Ukrainian text."""
-        chunker = DocumentChunker(
-            chunk_size=200,
-            chunk_overlap=50,
-            strategy=ChunkingStrategy.SENTENCE
-        )
-
-        text = (
-            "Це перше речення про візи до Великобританії. "
-            "Це друге речення про імміграційні правила. "
-            "Це третє речення про документи. "
-            "Це четверте речення про процедуру подачі заяви."
-        )
-
-        chunks = chunker.chunk_text(text)
-
-        assert len(chunks) > 0
-        # Check that sentences are not broken mid-word
-        for chunk in chunks:
-            assert not chunk.text.endswith("про")
-
-    def test_chunk_by_paragraphs(self):
-        """Test paragraph-aware chunking."""
-        chunker = DocumentChunker(
-            chunk_size=300,
-            chunk_overlap=50,
-            strategy=ChunkingStrategy.PARAGRAPH
-        )
-
-        text = """Перший абзац містить інформацію про візи.
-Він може бути досить довгим і детальним.
-
-Другий абзац розповідає про житло.
-Тут є корисні поради для іммігрантів.
-
-Третій абзац про роботу та навчання.
-Важлива інформація для новоприбулих."""
-
+    @pytest.mark.parametrize("strategy,size,overlap,text,expected", CHUNKING_CASES)
+    def test_chunking_invariants(self, strategy, size, overlap, text, expected):
+        """Test structural properties of chunks produced by each strategy."""
+        chunker = DocumentChunker(chunk_size=size, chunk_overlap=overlap, strategy=strategy)
         chunks = chunker.chunk_text(text)
 
-        assert len(chunks) > 0
-        # Paragraphs should be preserved when possible
+        assert len(chunks) >= expected.get("min_chunks", 1)
         for chunk in chunks:
             assert chunk.text.strip()
+            if "max_len" in expected:
+                assert len(chunk.text) <= expected["max_len"]
+            if "no_trailing" in expected:
+                # Sentences are not broken mid-phrase
+                assert not chunk.text.endswith(expected["no_trailing"])
 
-    def test_empty_text(self):
+    def test_empty_text(self, chunker):
         """Test handling of empty text."""
-        chunker = DocumentChunker(chunk_size=500, chunk_overlap=50)
-
         assert chunker.chunk_text("") == []
         assert chunker.chunk_text("   ") == []
         assert chunker.chunk_text("\n\n\n") == []
 
-    def test_metadata_preservation(self):
+    def test_metadata_preservation(self, small_chunker):
         """Test that metadata is preserved in chunks."""
-        chunker = DocumentChunker(chunk_size=100, chunk_overlap=20)
-
         metadata = {
             "source_url": "https://www.gov.uk/test",
             "topic": "visa",
@@ -108,7 +122,7 @@ class TestDocumentChunker:
         }
 
         text = "Короткий текст для тестування метаданих."
-        chunks = chunker.chunk_text(text, metadata)
+        chunks = small_chunker.chunk_text(text, metadata)
 
         assert len(chunks) > 0
         for chunk in chunks:
@@ -116,12 +130,10 @@ class TestDocumentChunker:
             assert chunk.metadata["topic"] == "visa"
             assert chunk.metadata["language"] == "uk"
 
-    def test_chunk_metadata_fields(self):
+    def test_chunk_metadata_fields(self, small_chunker):
         """Test that chunk-specific metadata is added."""
-        chunker = DocumentChunker(chunk_size=100, chunk_overlap=20)
-
         text = "A" * 250  # Long enough for multiple chunks
-        chunks = chunker.chunk_text(text)
+        chunks = small_chunker.chunk_text(text)
 
         assert len(chunks) > 1
 
@@ -131,10 +143,8 @@ class TestDocumentChunker:
             assert chunk.start_char >= 0
             assert chunk.end_char > chunk.start_char
 
-    def test_chunk_documents_multiple(self):
+    def test_chunk_documents_multiple(self, small_chunker):
         """Test chunking multiple documents."""
-        chunker = DocumentChunker(chunk_size=100, chunk_overlap=20)
-
         documents = [
             {
                 "text": "Перший документ про візи до Великобританії.",
@@ -146,7 +156,7 @@ class TestDocumentChunker:
             }
         ]
 
-        chunks = chunker.chunk_documents(documents)
+        chunks = small_chunker.chunk_documents(documents)
 
         assert len(chunks) >= 2  # At least one chunk per document
 
@@ -155,10 +165,8 @@ class TestDocumentChunker:
         assert 0 in doc_indices
         assert 1 in doc_indices
 
-    def test_chunk_to_dict(self):
+    def test_chunk_to_dict(self, chunker):
         """Test converting chunk to dictionary."""
-        chunker = DocumentChunker(chunk_size=500, chunk_overlap=50)
-
         metadata = {"topic": "housing"}
         text = "Тестовий текст про житло."
         chunks = chunker.chunk_text(text, metadata)
@@ -172,19 +180,6 @@ class TestDocumentChunker:
         assert "chunk_index" in chunk_dict["metadata"]
         assert "total_chunks" in chunk_dict["metadata"]
 
-    def test_long_sentence_splitting(self):
-        """Test that very long sentences are split properly."""
-        chunker = DocumentChunker(chunk_size=100, chunk_overlap=20)
-
-        # Create a very long sentence (no punctuation)
-        text = "Це дуже довге речення без жодних розділових знаків яке має бути розділене на частини " * 5
-
-        chunks = chunker.chunk_text(text)
-
-        assert len(chunks) > 1
-        for chunk in chunks:
-            assert len(chunk.text) <= 120  # Some tolerance for word boundaries
-
     def test_overlap_between_chunks(self):
         """Test that overlap is working correctly."""
         chunker = DocumentChunker(
@@ -193,16 +188,7 @@ class TestDocumentChunker:
             strategy=ChunkingStrategy.SENTENCE
         )
 
-        text = (
-            "Перше речення тексту. "
-            "Друге речення тексту. "
-            "Третє речення тексту. "
-            "Четверте речення тексту. "
-            "П'яте речення тексту. "
-            "Шосте речення тексту."
-        )
-
-        chunks = chunker.chunk_text(text)
+        chunks = chunker.chunk_text(UKR_SHORT_SENTENCES)
 
         if len(chunks) > 1:
             # Check that there's some content overlap
@@ -0,0 +1,40 @@
+"""Unit tests for document date parsing."""
+
+from datetime import datetime
+
+import pytest
+from src.utils.datetime_utils import parse_document_date
+
+
+class TestParseDocumentDate:
+    """Test cases for parse_document_date."""
+
+    @pytest.mark.parametrize("date_str,expected", [
+        ("2024-12-21T10:00:00", datetime(2024, 12, 21, 10, 0, 0)),
+        ("2024-12-21T10:00:00.500000", datetime(2024, 12, 21, 10, 0, 0, 500000)),
+        ("2024-12-21", datetime(2024, 12, 21)),
+        ("21/12/2024", datetime(2024, 12, 21)),
+        ("21-12-2024", datetime(2024, 12, 21)),
+        ("2024-12-21T10:00:00+02:00", datetime(2024, 12, 21, 10, 0, 0)),
+        ("2024-12-21T10:00:00Z", datetime(2024, 12, 21, 10, 0, 0)),
+    ])
+    def test_supported_formats(self, date_str, expected):
+        """Test that supported formats parse to the expected naive datetime."""
+        assert parse_document_date(date_str) == expected
+
+    def test_negative_offset_is_naive(self):
+        """Test that negative UTC offsets give a naive datetime comparable to now()."""
+        parsed = parse_document_date("2024-01-01T10:00:00-05:00")
+
+        assert parsed == datetime(2024, 1, 1, 10, 0, 0)
+        assert parsed.tzinfo is None
+        assert datetime.now() - parsed  # must not raise TypeError
+
+    @pytest.mark.parametrize("date_str", ["", "not a date"])
+    def test_invalid(self, date_str):
+        """Test that empty or unparseable strings return None."""
+        assert parse_document_date(date_str) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -3,86 +3,92 @@
 import pytest
 from src.language.detector import LanguageDetector
 
+UKRAINIAN_TEXTS = [
+    "Як продовжити візу?",
+    "Де знайти лікаря?",
+    "Я хочу отримати допомогу",
+    "Дякую за допомогу",
+    "Чи можу я подорожувати?"
+]
+
+RUSSIAN_TEXTS = [
+    "Как продлить визу?",
+    "Где найти врача?",
+    "Я хочу получить помощь",
+    "Спасибо за помощь",
+    "Могу ли я путешествовать?"
+]
+
+UKRAINIAN_SPECIFIC = [
+    "їжа",  # contains ї
+    "євро",  # contains є
+    "Київ",  # contains ї
+    "Україна",  # contains ї
+    "ґанок"  # contains ґ
+]
+
+RUSSIAN_SPECIFIC = [
+    "еда",  # normal Russian word
+    "это",  # contains э
+    "объект",  # contains ъ
+    "ёлка",  # contains ё
+    "вы можете"  # contains ы
+]
+
+
+@pytest.fixture(scope="session")
+def detector():
+    """Detector shared by all tests; it keeps no per-call state."""
+    return LanguageDetector()
+
 
 class TestLanguageDetector:
     """Test cases for LanguageDetector."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.detector = LanguageDetector()
-
-    def test_detect_ukrainian(self):
+    @pytest.mark.parametrize("text", UKRAINIAN_TEXTS)
+    def test_detect_ukrainian(self, detector, text):
         """Test detection of Ukrainian text."""
-        ukrainian_texts = [
-            "Як продовжити візу?",
-            "Де знайти лікаря?",
-            "Я хочу отримати допомогу",
-            "Дякую за допомогу",
-            "Чи можу я подорожувати?"
-        ]
-
-        for text in ukrainian_texts:
-            lang = self.detector.detect(text)
-            assert lang == "uk", f"Expected uk, got {lang} for text: {text}"
-
-    def test_detect_russian(self):
+        assert detector.detect(text) == "uk"
+
+    @pytest.mark.parametrize("text", RUSSIAN_TEXTS)
+    def test_detect_russian(self, detector, text):
         """Test detection of Russian text."""
-        russian_texts = [
-            "Как продлить визу?",
-            "Где найти врача?",
-            "Я хочу получить помощь",
-            "Спасибо за помощь",
-            "Могу ли я путешествовать?"
-        ]
-
-        for text in russian_texts:
-            lang = self.detector.detect(text)
-            assert lang == "ru", f"Expected ru, got {lang} for text: {text}"
-
-    def test_detect_ukrainian_specific_chars(self):
+        assert detector.detect(text) == "ru"
+
+    @pytest.mark.parametrize("text", UKRAINIAN_SPECIFIC)
+    def test_detect_ukrainian_specific_chars(self, detector, text):
         """Test detection using Ukrainian-specific characters."""
-        # These words contain Ukrainian-specific letters
-        ukrainian_specific = [
-            "їжа",  # contains ї
-            "євро",  # contains є
-            "Київ",  # contains ї
-            "Україна",  # contains ї
-            "ґанок"  # contains ґ
-        ]
-
-        for text in ukrainian_specific:
-            lang = self.detector.detect(text)
-            assert lang == "uk", f"Expected uk, got {lang} for text: {text}"
-
-    def test_detect_russian_specific_chars(self):
+        assert detector.detect(text) == "uk"
+
+    @pytest.mark.parametrize("text", RUSSIAN_SPECIFIC)
+    def test_detect_russian_specific_chars(self, detector, text):
         """Test detection using Russian-specific characters."""
-        # These words contain Russian-specific letters
-        russian_specific = [
-            "еда",  # normal Russian word
-            "это",  # contains э
-            "объект",  # contains ъ
-            "ёлка",  # contains ё
-            "вы можете"  # contains ы
-        ]
-
-        for text in russian_specific:
-            lang = self.detector.detect(text)
-            assert lang == "ru", f"Expected ru, got {lang} for text: {text}"
-
-    def test_is_ukrainian(self):
+        assert detector.detect(text) == "ru"
+
+    def test_is_ukrainian(self, detector):
         """Test is_ukrainian method."""
-        assert self.detector.is_ukrainian("Як справи?")
-        assert not self.detector.is_ukrainian("Как дела?")
+        assert detector.is_ukrainian("Як справи?")
+        assert not detector.is_ukrainian("Как дела?")
 
-    def test_is_russian(self):
+    def test_is_russian(self, detector):
         """Test is_russian method."""
-        assert self.detector.is_russian("Как дела?")
-        assert not self.detector.is_russian("Як справи?")
-
-    def test_empty_text(self):
+        assert detector.is_russian("Как дела?")
+        assert not detector.is_russian("Як справи?")
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Добрий ранок", "uk"),
+        ("Добрий ранок, Mr Smith", "uk"),
+        ("Hello there", "unknown"),
+        ("How do I extend my visa?", "unknown")
+    ])
+    def test_cyrillic_ratio_fallback(self, detector, text, expected):
+        """Test fallback for text without specific characters or known words."""
+        assert detector.detect(text) == expected
+
+    @pytest.mark.parametrize("text", ["", "   ", "\n\t "])
+    def test_empty_text(self, detector, text):
         """Test detection with empty text."""
-        assert self.detector.detect("") == "unknown"
-        assert self.detector.detect("   ") == "unknown"
+        assert detector.detect(text) == "unknown"
 
 
 if __name__ == "__main__":
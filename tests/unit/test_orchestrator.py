@@ -3,87 +3,83 @@
 import pytest
 from src.agents.orchestrator import OrchestratorAgent
 
+VISA_QUERIES = [
+    "Як продовжити УПЕ візу?",
+    "Чи можу я подорожувати з BRP?",
+    "Питання про імміграцію",
+    "Де отримати дозвіл на проживання?"
+]
+
+HOUSING_QUERIES = [
+    "Де зареєструватися у NHS?",
+    "Як знайти GP у моєму районі?",
+    "Питання про житло та оренду",
+    "Як записати дитину до школи?"
+]
+
+WORK_QUERIES = [
+    "Як отримати NI number?",
+    "Де подати на Universal Credit?",
+    "Питання про роботу та зарплату",
+    "Які у мене права як працівника?"
+]
+
+UNCERTAIN_QUERIES = [
+    "Привіт!",
+    "Як справи?",
+    "Що нового?"
+]
+
+
+@pytest.fixture(scope="module")
+def orchestrator():
+    """
+    Orchestrator shared by the tests in this module.
+
+    The tests only read from it, so the lazily built specialized agents
+    are created once instead of once per test.
+    """
+    return OrchestratorAgent()
+
 
 class TestOrchestratorAgent:
     """Test cases for OrchestratorAgent."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.orchestrator = OrchestratorAgent()
-
-    def test_keyword_classify_visa(self):
+    @pytest.mark.parametrize("query", VISA_QUERIES)
+    def test_keyword_classify_visa(self, orchestrator, query):
         """Test keyword classification for visa queries."""
-        queries = [
-            "Як продовжити УПЕ візу?",
-            "Чи можу я подорожувати з BRP?",
-            "Питання про імміграцію",
-            "Де отримати дозвіл на проживання?"
-        ]
-
-        for query in queries:
-            intent = self.orchestrator._keyword_classify(query)
-            assert intent == "visa", f"Expected visa, got {intent} for query: {query}"
-
-    def test_keyword_classify_housing(self):
+        assert orchestrator._keyword_classify(query) == "visa"
+
+    @pytest.mark.parametrize("query", HOUSING_QUERIES)
+    def test_keyword_classify_housing(self, orchestrator, query):
         """Test keyword classification for housing queries."""
-        queries = [
-            "Де зареєструватися у NHS?",
-            "Як знайти GP у моєму районі?",
-            "Питання про житло та оренду",
-            "Як записати дитину до школи?"
-        ]
-
-        for query in queries:
-            intent = self.orchestrator._keyword_classify(query)
-            assert intent == "housing", f"Expected housing, got {intent} for query: {query}"
-
-    def test_keyword_classify_work(self):
-        """Test keyword classification for work queries."""
-        queries = [
-            "Як отримати NI number?",
-            "Де подати на Universal Credit?",
-            "Питання про роботу та зарплату",
-            "Які у мене права як працівника?"
-        ]
-
-        for query in queries:
-            intent = self.orchestrator._keyword_classify(query)
-            assert intent == "work", f"Expected work, got {intent} for query: {query}"
-
-    def test_keyword_classify_uncertain(self):
-        """Test keyword classification for uncertain queries."""
-        queries = [
-            "Привіт!",
-            "Як справи?",
-            "Що нового?"
-        ]
+        assert orchestrator._keyword_classify(query) == "housing"
 
-        for query in queries:
-            intent = self.orchestrator._keyword_classify(query)
-            assert intent == "uncertain", f"Expected uncertain, got {intent} for query: {query}"
+    @pytest.mark.parametrize("query", WORK_QUERIES)
+    def test_keyword_classify_work(self, orchestrator, query):
+        """Test keyword classification for work queries."""
+        assert orchestrator._keyword_classify(query) == "work"
 
-    def test_get_agent(self):
+    @pytest.mark.parametrize("query", UNCERTAIN_QUERIES)
+    def test_keyword_classify_uncertain(self, orchestrator, query):
+        """Test keyword classification for uncertain queries."""
+        assert orchestrator._keyword_classify(query) == "uncertain"
+
+    @pytest.mark.parametrize("agent_type,name", [
+        ("visa", "visa_agent"),
+        ("housing", "housing_agent"),
+        ("work", "work_agent"),
+        ("general", "fallback_agent")
+    ])
+    def test_get_agent(self, orchestrator, agent_type, name):
         """Test agent retrieval."""
-        # Test valid agent types
-        visa_agent = self.orchestrator.get_agent("visa")
-        assert visa_agent is not None
-        assert visa_agent.name == "visa_agent"
-
-        housing_agent = self.orchestrator.get_agent("housing")
-        assert housing_agent is not None
-        assert housing_agent.name == "housing_agent"
-
-        work_agent = self.orchestrator.get_agent("work")
-        assert work_agent is not None
-        assert work_agent.name == "work_agent"
-
-        general_agent = self.orchestrator.get_agent("general")
-        assert general_agent is not None
-        assert general_agent.name == "fallback_agent"
+        agent = orchestrator.get_agent(agent_type)
+        assert agent is not None
+        assert agent.name == name
 
-    def test_get_agent_unknown_type(self):
+    def test_get_agent_unknown_type(self, orchestrator):
         """Test agent retrieval with unknown type."""
-        agent = self.orchestrator.get_agent("unknown_type")
+        agent = orchestrator.get_agent("unknown_type")
         assert agent is not None
         # Should return fallback agent
         assert agent.name == "fallback_agent"